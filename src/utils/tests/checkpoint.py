@@ -0,0 +1,104 @@
+"""Checkpointed, resumable counting for long ingestion runs.
+
+``count_resumable`` counts the input files block by block and, every
+``interval`` seconds, pickles the partial counter together with the current
+file index and the byte offset (in the decompressed stream) just past the
+last complete line counted. Checkpoints are written to a temporary file,
+fsynced and renamed over the previous one, so a crash leaves either the old
+or the new checkpoint, never a torn one. Resuming seeks plain files straight
+to the offset; compressed inputs are decompressed up to it without counting.
+
+The checkpoint records each input's size and modification time, and resuming
+refuses a file that has changed since, as its offset would no longer line up.
+
+Every checkpoint pickles the whole counter, so its cost grows with the number
+of distinct labels rather than the lines read since the last one: on the
+order of a second and 100 MB per save at two million labels. Raise
+``interval`` for high-cardinality inputs.
+"""
+
+import os
+import pickle
+import time
+from collections import Counter
+
+from decompress import iter_chunks, split_lines
+
+FORMAT = 'region-count-checkpoint/2'
+
+
+def fingerprint(path):
+    """Return ``(size, mtime_ns)`` for ``path``, or ``None`` for stdin."""
+    if path == '-':
+        return None
+    stat = os.stat(path)
+    return stat.st_size, stat.st_mtime_ns
+
+
+def save_checkpoint(path, state):
+    tmp = f"{path}.tmp"
+    with open(tmp, 'wb') as f:
+        pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+def load_checkpoint(path, paths):
+    with open(path, 'rb') as f:
+        state = pickle.load(f)
+    if state.get('format') != FORMAT:
+        raise ValueError(f"{path}: not a counting checkpoint")
+    if state['paths'] != list(paths):
+        raise ValueError(f"{path}: checkpoint was taken for inputs {state['paths']}")
+    for input_path, recorded in zip(state['paths'], state['fingerprints']):
+        if fingerprint(input_path) != recorded:
+            raise ValueError(f"{path}: {input_path} has changed since the checkpoint was taken")
+    return state
+
+
+def count_resumable(paths, checkpoint_path, interval=5.0, resume=False, normalizer=None):
+    """Count regions in ``paths``, checkpointing to ``checkpoint_path``.
+
+    The checkpoint is removed once counting completes.
+    """
+    if resume and os.path.exists(checkpoint_path):
+        state = load_checkpoint(checkpoint_path, paths)
+        if normalizer is not None:
+            normalizer.changed.update(state['normalized'])
+    else:
+        state = {'format': FORMAT, 'paths': list(paths), 'index': 0, 'offset': 0,
+                 'fingerprints': [fingerprint(path) for path in paths],
+                 'counts': Counter(), 'normalized': Counter()}
+    counts = state['counts']
+
+    def save(index, offset):
+        state.update(index=index, offset=offset)
+        if normalizer is not None:
+            state['normalized'] = normalizer.changed
+        save_checkpoint(checkpoint_path, state)
+
+    def count_block(block):
+        lines = split_lines(block, transform=normalizer)
+        counts.update(region for region in (line.strip() for line in lines) if region)
+
+    next_save = time.monotonic() + interval
+    for index in range(state['index'], len(paths)):
+        offset = state['offset'] if index == state['index'] else 0
+        tail = b''
+        for chunk in iter_chunks(paths[index], start=offset):
+            chunk = tail + chunk
+            cut = chunk.rfind(b'\n') + 1
+            tail = chunk[cut:]
+            if cut:
+                count_block(chunk[:cut])
+                offset += cut
+            if time.monotonic() >= next_save:
+                save(index, offset)
+                next_save = time.monotonic() + interval
+        if tail:
+            count_block(tail + b'\n')
+
+    if os.path.exists(checkpoint_path):
+        os.remove(checkpoint_path)
+    return counts
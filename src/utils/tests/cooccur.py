@@ -0,0 +1,58 @@
+"""Co-occurrence counts of region pairs per order or member cellar.
+
+Input is grouped: ``(group_id, region)`` records where each group's records
+are contiguous (an export ordered by order_id or member_id). Regions are
+interned to integer codes and every unordered pair within a group is
+counted once, keyed by the two codes packed into one int. The matrix is a
+sparse dict of those keys, so memory grows with the number of distinct
+region pairs and never with the number of orders.
+"""
+
+import heapq
+from collections import Counter
+from itertools import combinations, groupby
+
+_SHIFT = 32
+
+
+class PairCounter:
+    """Sparse, integer-coded region pair matrix."""
+
+    def __init__(self):
+        self._codes = {}
+        self.labels = []
+        self.pairs = Counter()
+        self.groups = 0
+
+    def _code(self, label):
+        code = self._codes.get(label)
+        if code is None:
+            code = self._codes[label] = len(self.labels)
+            self.labels.append(label)
+        return code
+
+    def add_group(self, labels):
+        """Count each unordered pair of distinct regions in one group."""
+        codes = sorted({self._code(label) for label in labels})
+        self.groups += 1
+        pairs = self.pairs
+        for a, b in combinations(codes, 2):
+            pairs[a << _SHIFT | b] += 1
+
+    def add_records(self, records):
+        """Consume contiguous ``(group_id, region)`` records."""
+        for _, group in groupby(records, key=lambda record: record[0]):
+            self.add_group(region for _, region in group)
+
+    def top(self, n):
+        """Return the ``n`` most frequent ``(region_a, region_b, count)`` pairs."""
+        mask = (1 << _SHIFT) - 1
+        labels = self.labels
+
+        def decode(item):
+            key, count = item
+            a, b = sorted((labels[key >> _SHIFT], labels[key & mask]))
+            return a, b, count
+
+        rows = (decode(item) for item in self.pairs.items())
+        return heapq.nsmallest(n, rows, key=lambda row: (-row[2], row[0], row[1]))
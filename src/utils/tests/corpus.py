@@ -0,0 +1,158 @@
+"""Regression corpus for the region counter.
+
+``fixtures/regions.txt`` is the club's region list (formerly the data block
+embedded in list-counter.py). ``build_corpus`` writes it alongside generated
+edge cases: empty and blank-line files, Unicode and whitespace variants of
+one label, a single repeated key, a file without a trailing newline, CRLF
+endings, a high-cardinality file and a large gzip-compressed file. The
+generated files are deterministic, so they are rebuilt on demand rather than
+committed.
+
+``build_vectors`` writes seeded embeddings for the region list so --vectors
+can be checked too. ``build_mode_cases`` adds pairs of runs that must print
+the same report: a dirty copy of a file read with --normalize against the
+clean file, for the plain list and for the tab-delimited --pairs, --vintages
+and --stratify inputs.
+"""
+
+import gzip
+import os
+import unicodedata
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+REGIONS = os.path.join(FIXTURES_DIR, 'regions.txt')
+
+HUGE_LINES = 300_000
+HIGH_CARDINALITY_KEYS = 50_000
+
+_UNICODE_VARIANTS = [
+    'Northern Rhône Côte-Rotie',
+    unicodedata.normalize('NFD', 'Northern Rhône Côte-Rotie'),
+    'Northern Rhone Cote-Rotie',
+    'NORTHERN RHÔNE CÔTE-ROTIE',
+    'Northern\u00a0Rhône Côte-Rotie',
+    'Northern Rhône  Côte-Rotie',
+    'Northern Rhône Côte-Rotie\t',
+    'Mexican Rose',
+    'Mexican Rosé',
+    'Jura Vin Jaune',
+    'Œil de Perdrix Rosé',
+    'Spätburgunder',
+]
+
+
+def _write(path, text):
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        f.write(text)
+    return path
+
+
+def build_corpus(directory, huge_lines=HUGE_LINES):
+    """Write the generated edge cases into ``directory``; return all corpus paths."""
+    with open(REGIONS, encoding='utf-8', newline='') as f:
+        regions = f.read()
+    labels = regions.splitlines()
+    paths = [REGIONS]
+    paths.append(_write(os.path.join(directory, 'empty.txt'), ''))
+    paths.append(_write(os.path.join(directory, 'blank-lines.txt'),
+                        '\n\n   \n\t\n' + '\n\n'.join(labels[:50]) + '\n \n'))
+    paths.append(_write(os.path.join(directory, 'unicode.txt'),
+                        '\n'.join(_UNICODE_VARIANTS * 3) + '\n'))
+    paths.append(_write(os.path.join(directory, 'single-key.txt'), 'Burgundy White\n' * 5000))
+    paths.append(_write(os.path.join(directory, 'no-trailing-newline.txt'), regions.rstrip('\n')))
+    paths.append(_write(os.path.join(directory, 'crlf.txt'), regions.replace('\n', '\r\n')))
+    paths.append(_write(os.path.join(directory, 'high-cardinality.txt'), ''.join(
+        f"Producer {i % HIGH_CARDINALITY_KEYS:05d} {labels[i % len(labels)]} {1990 + i % 33}\n"
+        for i in range(2 * HIGH_CARDINALITY_KEYS)
+    )))
+    huge = os.path.join(directory, 'huge.txt.gz')
+    with gzip.open(huge, 'wt', encoding='utf-8', newline='', compresslevel=1) as f:
+        for start in range(0, huge_lines, len(labels)):
+            f.write('\n'.join(labels[:huge_lines - start]) + '\n')
+    paths.append(huge)
+    return paths
+
+
+def build_vectors(directory, dimensions=8):
+    """Write seeded random embeddings for the region list; return the .npy path, or None without NumPy.
+
+    Labels are embedded by word, so regions sharing words end up close
+    enough to cluster at a moderate similarity.
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        return None
+    with open(REGIONS, encoding='utf-8') as f:
+        labels = sorted(set(f.read().splitlines()))
+    rng = np.random.default_rng(41)
+    words = {}
+    matrix = np.zeros((len(labels), dimensions), dtype=np.float32)
+    for row, label in enumerate(labels):
+        for word in label.split():
+            if word not in words:
+                words[word] = rng.standard_normal(dimensions)
+            matrix[row] += words[word]
+    path = os.path.join(directory, 'regions-vectors.npy')
+    np.save(path, matrix)
+    _write(os.path.join(directory, 'regions-vectors.txt'), ''.join(f"{label}\n" for label in labels))
+    return path
+
+
+def _dirty(label, i):
+    """One of several whitespace corruptions that --normalize must undo."""
+    kind = i % 7
+    if kind == 0:
+        return label.replace(' ', '\u00a0', 1)
+    if kind == 1:
+        return label.replace(' ', '  ')
+    if kind == 2:
+        return f"  {label}\t"
+    if kind == 3:
+        return f"\u2003{label}\u202f"
+    if kind == 4:
+        return label + '\r'
+    if kind == 5:
+        return label.replace(' ', ' \u2007 ', 1)
+    return label
+
+
+def build_mode_cases(directory):
+    """Write the clean/dirty inputs for mode checks; return ``(name, reference_args, args)`` cases.
+
+    Both runs of a case must print the same report, apart from the
+    normalization summary that --normalize appends.
+    """
+    with open(REGIONS, encoding='utf-8') as f:
+        labels = f.read().splitlines()
+
+    def write_pair(name, rows):
+        clean = _write(os.path.join(directory, f"{name}.tsv"), ''.join(f"{key}\t{label}\n" for key, label in rows))
+        dirty = _write(os.path.join(directory, f"{name}-dirty.tsv"), ''.join(
+            f"{key}\t{_dirty(label, i)}\n" for i, (key, label) in enumerate(rows)
+        ))
+        return clean, dirty
+
+    dirty = _write(os.path.join(directory, 'dirty.txt'), ''.join(
+        _dirty(label, i) + '\n' for i, label in enumerate(labels)
+    ))
+    orders, orders_dirty = write_pair('orders', [(f"order-{i // 3}", label) for i, label in enumerate(labels)])
+    businesses, businesses_dirty = write_pair('businesses', [(f"business-{i % 5}", label) for i, label in enumerate(labels)])
+    # Vintage rows put the region first, so they are written separately
+    vintages = [(label, 'NV' if i % 9 == 0 else str(1985 + i * 7 % 38)) for i, label in enumerate(labels)]
+    vintages_clean = _write(os.path.join(directory, 'vintages.tsv'), ''.join(
+        f"{label}\t{year}\n" for label, year in vintages
+    ))
+    vintages_dirty = _write(os.path.join(directory, 'vintages-dirty.tsv'), ''.join(
+        f"{_dirty(label, i)}\t{year}\n" for i, (label, year) in enumerate(vintages)
+    ))
+
+    report = ['--top', '40', '--collate', '--stats', '--styles']
+    return [
+        ('normalize', [REGIONS, *report], [dirty, '--normalize', *report]),
+        ('pairs', [orders, '--pairs', '25'], [orders_dirty, '--normalize', '--pairs', '25']),
+        ('stratify', [businesses, '--sample', '150', '--stratify', '--seed', '7', '--top', '15'],
+         [businesses_dirty, '--normalize', '--sample', '150', '--stratify', '--seed', '7', '--top', '15']),
+        ('vintages', [vintages_clean, '--vintages', '--by-decade', '--vintage-range', '2000-2012', '--top', '30'],
+         [vintages_dirty, '--normalize', '--vintages', '--by-decade', '--vintage-range', '2000-2012', '--top', '30']),
+    ]
@@ -0,0 +1,145 @@
+"""Streaming line reader for plain and compressed region exports.
+
+Region exports are archived as .gz/.bz2/.xz/.zst. Rather than decompressing
+to disk first, ``iter_lines`` decompresses on a background thread and hands
+fixed-size chunks to the caller through a small bounded queue, so
+decompression and counting overlap and at most a few chunks are ever held in
+memory. gzip, bz2 and lzma all release the GIL while inflating.
+"""
+
+import importlib
+import queue
+import sys
+import threading
+
+CHUNK_SIZE = 1 << 20  # bytes handed to the consumer per queue item
+QUEUE_DEPTH = 4  # chunks buffered ahead of the consumer
+
+_DONE = object()
+
+
+def _open_zstd(path):
+    try:
+        from compression import zstd  # Python 3.14+
+    except ImportError:
+        pass
+    else:
+        return zstd.open(path, 'rb')
+    try:
+        import zstandard
+    except ImportError:
+        raise RuntimeError(
+            f"{path}: reading .zst input needs Python 3.14+ or the 'zstandard' package"
+        ) from None
+    return zstandard.ZstdDecompressor().stream_reader(open(path, 'rb'), closefd=True)
+
+
+def _open_module(name):
+    # Codecs are imported on first use to keep startup cheap
+    def opener(path):
+        return importlib.import_module(name).open(path, 'rb')
+    return opener
+
+
+_OPENERS = {
+    '.gz': _open_module('gzip'),
+    '.bz2': _open_module('bz2'),
+    '.xz': _open_module('lzma'),
+    '.zst': _open_zstd,
+}
+
+
+def open_binary(path):
+    """Open ``path`` for binary reading, decompressing by file extension.
+
+    ``-`` reads standard input.
+    """
+    if path == '-':
+        return sys.stdin.buffer
+    for suffix, opener in _OPENERS.items():
+        if path.endswith(suffix):
+            return opener(path)
+    return open(path, 'rb')
+
+
+def _skip(stream, start, chunk_size):
+    try:
+        stream.seek(start)
+    except (OSError, ValueError):  # pipes and other unseekable streams
+        while start > 0:
+            skipped = len(stream.read(min(chunk_size, start)))
+            if not skipped:
+                break
+            start -= skipped
+
+
+def iter_chunks(path, chunk_size=CHUNK_SIZE, depth=QUEUE_DEPTH, start=0):
+    """Yield decompressed byte chunks of ``path`` read on a worker thread.
+
+    ``start`` is an offset into the decompressed stream to begin at.
+    """
+    chunks = queue.Queue(maxsize=depth)
+    stop = threading.Event()
+
+    def put(item):
+        while not stop.is_set():
+            try:
+                chunks.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce():
+        try:
+            stream = open_binary(path)
+            try:
+                if start:
+                    _skip(stream, start, chunk_size)
+                while True:
+                    chunk = stream.read(chunk_size)
+                    if not chunk or not put(chunk):
+                        break
+            finally:
+                if stream is not sys.stdin.buffer:
+                    stream.close()
+        except BaseException as exc:  # re-raised on the consumer side
+            put(exc)
+        put(_DONE)
+
+    worker = threading.Thread(target=produce, name=f"decompress:{path}", daemon=True)
+    worker.start()
+    try:
+        while True:
+            item = chunks.get()
+            if item is _DONE:
+                break
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+    finally:
+        stop.set()
+        worker.join()
+
+
+def split_lines(block, encoding='utf-8', transform=None):
+    """Decode a block of ``\\n``-terminated lines, applying ``transform`` to the raw bytes first."""
+    if transform is not None:
+        block = transform(block)
+    return block.decode(encoding).split('\n')[:-1]
+
+
+def iter_lines(path, encoding='utf-8', transform=None):
+    """Yield the text lines of ``path`` (without ``\n`` terminators).
+
+    ``transform`` is applied to each block of complete lines as bytes.
+    """
+    tail = b''
+    for chunk in iter_chunks(path):
+        chunk = tail + chunk
+        cut = chunk.rfind(b'\n') + 1
+        tail = chunk[cut:]
+        if cut:
+            yield from split_lines(chunk[:cut], encoding, transform)
+    if tail:
+        yield from split_lines(tail + b'\n', encoding, transform)
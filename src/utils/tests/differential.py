@@ -0,0 +1,180 @@
+"""Differential check of every counting engine against the serial one.
+
+Runs list-counter.py over the regression corpus (see ``corpus.py``) once per
+engine and report mode and asserts that each report is byte-identical to the
+plain serial run, recording each engine's wall time. The engines covered are
+the ones this tree has:
+
+    serial       plain in-memory Counter and sort
+    stdin        input streamed through '-'
+    spill        --memory-budget: spilled count runs, parallel spilled sort
+    mmap         --write-snapshot, then a report from the mapped snapshot
+    incremental  per-part summaries merged with --merge-summaries
+    checkpoint   --checkpoint taken after every block
+
+Each engine runs in every mode it supports (``MODES``: --top, --collate,
+--normalize with --stats and --styles, and --vectors over the embeddings
+from ``corpus.build_vectors`` when NumPy is installed). The mode cases from
+``corpus.build_mode_cases`` then check --normalize against clean references,
+including the tab-delimited --pairs, --vintages and --stratify inputs.
+
+Exits non-zero on any mismatch, printing the first differing line.
+"""
+
+import argparse
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import time
+
+from corpus import HUGE_LINES, build_corpus, build_mode_cases, build_vectors
+from decompress import open_binary
+
+COUNTER = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'list-counter.py')
+SPILL_TRAILER = re.compile(rb'\nSpilled count runs: [^\n]*\nPeak memory: [^\n]*\n')
+NORMALIZATION_SUMMARY = re.compile(rb'\nLines changed by normalization rule:\n(?:[a-z]+: \d+\n)+')
+
+MODES = {
+    'default': [],
+    'top': ['--top', '25'],
+    'collate': ['--collate', '--top', '60'],
+    'analysis': ['--normalize', '--stats', '--styles'],
+    'vectors': ['--vectors', '{vectors}', '--similarity', '0.85', '--top', '40'],
+}
+
+
+def _run(args, stdin=None):
+    with open(stdin, 'rb') if stdin else open(os.devnull, 'rb') as f:
+        result = subprocess.run([sys.executable, COUNTER, *args], stdin=f, capture_output=True)
+    if result.returncode:
+        raise RuntimeError(f"list-counter.py {' '.join(args)} failed:\n{result.stderr.decode(errors='replace')}")
+    return result.stdout
+
+
+def _split(path, workdir, parts=3):
+    """Split ``path`` (decompressed) into ``parts`` files at line boundaries."""
+    with open_binary(path) as f:
+        data = f.read()
+    cuts = [0]
+    for k in range(1, parts):
+        cut = data.find(b'\n', k * len(data) // parts)
+        cuts.append(len(data) if cut < 0 else max(cut + 1, cuts[-1]))
+    cuts.append(len(data))
+    paths = []
+    for k in range(parts):
+        part = os.path.join(workdir, f"part-{k}.txt")
+        with open(part, 'wb') as f:
+            f.write(data[cuts[k]:cuts[k + 1]])
+        paths.append(part)
+    return paths
+
+
+def serial(path, workdir, extra):
+    return _run([path, *extra])
+
+
+def stdin(path, workdir, extra):
+    if path.endswith(('.gz', '.bz2', '.xz', '.zst')):
+        return None  # '-' reads raw bytes; compressed input is covered by the path engines
+    return _run(['-', *extra], stdin=path)
+
+
+def spill(path, workdir, extra):
+    report = _run([path, '--memory-budget', '0.05', '--sort-workers', '2', *extra])
+    return SPILL_TRAILER.sub(b'', report, count=1)
+
+
+def mmap(path, workdir, extra):
+    if any(arg.startswith('--') and arg != '--top' for arg in extra):
+        return None  # a snapshot report only supports --top
+    snapshot = os.path.join(workdir, 'counts.snap')
+    _run([path, '--write-snapshot', snapshot])
+    return _run(['--snapshot', snapshot, *extra])
+
+
+def incremental(path, workdir, extra):
+    if any(arg.startswith('--') and arg not in ('--top', '--collate') for arg in extra):
+        return None  # merged summaries only support --top and --collate
+    summaries = []
+    for k, part in enumerate(_split(path, workdir)):
+        summary = os.path.join(workdir, f"part-{k}.json")
+        _run([part, '--write-summary', summary, '--source', f"part-{k}"])
+        summaries.append(summary)
+    return _run(['--merge-summaries', *summaries, *extra])
+
+
+def checkpoint(path, workdir, extra):
+    return _run([path, '--checkpoint', os.path.join(workdir, 'counts.ckpt'), '--checkpoint-every', '0', *extra])
+
+
+ENGINES = {engine.__name__: engine for engine in (serial, stdin, spill, mmap, incremental, checkpoint)}
+
+
+def first_difference(expected, actual):
+    for number, (a, b) in enumerate(zip(expected.splitlines(), actual.splitlines()), 1):
+        if a != b:
+            return f"line {number}: expected {a!r}, got {b!r}"
+    return f"line counts differ: expected {len(expected.splitlines())}, got {len(actual.splitlines())}"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Check that every counting engine produces identical reports.")
+    parser.add_argument('paths', nargs='*', help="extra inputs to check besides the corpus")
+    parser.add_argument('--engine', action='append', choices=sorted(ENGINES), help="only run these engines (repeatable)")
+    parser.add_argument('--mode', action='append', choices=list(MODES), help="only run these report modes (repeatable)")
+    parser.add_argument('--huge-lines', type=int, default=HUGE_LINES, help=f"lines in the generated large file (default: {HUGE_LINES})")
+    parser.add_argument('--keep', metavar='DIR', help="write the generated corpus to DIR instead of a temporary directory")
+    args = parser.parse_args(argv)
+
+    engines = [name for name in ENGINES if name == 'serial' or not args.engine or name in args.engine]
+    modes = args.mode or list(MODES)
+    failures = 0
+
+    def check(label, mode, name, expected, run):
+        nonlocal failures
+        start = time.perf_counter()
+        report = run()
+        elapsed = time.perf_counter() - start
+        if report is None:
+            return expected
+        if expected is None:
+            expected = report
+            status = "reference"
+        elif report == expected:
+            status = "ok"
+        else:
+            failures += 1
+            status = f"MISMATCH ({first_difference(expected, report)})"
+        print(f"{label:<24} {mode:<9} {name:<12} {elapsed:8.3f}s  {status}")
+        return expected
+
+    with tempfile.TemporaryDirectory(prefix='differential-') as tmp:
+        corpus_dir = args.keep or tmp
+        os.makedirs(corpus_dir, exist_ok=True)
+        vectors = build_vectors(corpus_dir)
+        if vectors is None and 'vectors' in modes:
+            print("NumPy is not installed; skipping the vectors mode")
+            modes.remove('vectors')
+        for path in build_corpus(corpus_dir, args.huge_lines) + args.paths:
+            for mode in modes:
+                extra = [arg.format(vectors=vectors) for arg in MODES[mode]]
+                expected = None
+                for name in engines:
+                    workdir = tempfile.mkdtemp(dir=tmp)
+                    expected = check(os.path.basename(path), mode, name, expected,
+                                     lambda: ENGINES[name](path, workdir, extra))
+
+        # --normalize on a dirty copy must match the clean input, apart from
+        # the normalization summary
+        for case, reference_args, case_args in build_mode_cases(corpus_dir):
+            expected = check(case, 'clean', 'serial', None, lambda: _run(reference_args))
+            check(case, 'dirty', 'serial', expected, lambda: NORMALIZATION_SUMMARY.sub(b'', _run(case_args), count=1))
+    if failures:
+        print(f"\n{failures} report(s) differ from their reference")
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
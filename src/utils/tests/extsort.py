@@ -0,0 +1,180 @@
+"""External sort of counts into report order under a memory budget.
+
+A single in-process ``sorted()`` is the fastest way to order counts that fit
+in memory, so ``sort_counts`` uses it whenever it can. Only when a memory
+budget is set and the items would exceed it does it fall back to an external
+sort: the items are cut into runs sized so that the runs held at once stay
+inside the budget, each run is sorted and spilled to disk, and the runs are
+streamed back through a k-way heap merge. At most ``FAN_IN`` runs are open
+at once: with more runs than that, groups of them are first merged into
+longer runs over as many passes as it takes (``reduce_runs``), so thousands
+of runs never exhaust the open-file limit. Runs can optionally be sorted in
+worker processes. The ordering is the same either way: count descending,
+then key ascending, or the collated key when a ``collation.Collator`` is
+passed. Spilled runs carry the collator's sort string next to each count,
+so the merge compares plain tuples and no per-label key cache builds up.
+"""
+
+import heapq
+import os
+import sys
+from collections import deque
+from operator import itemgetter
+
+ITEM_OVERHEAD = 120  # rough bytes per (key, count) pair beyond the key itself
+FAN_IN = 64  # runs merged at once, well inside common open-file limits
+
+
+def report_key(item):
+    return (-item[1], item[0])
+
+
+def item_bytes(key):
+    """Rough in-memory footprint of one ``(key, count)`` pair."""
+    return sys.getsizeof(key) + ITEM_OVERHEAD
+
+
+def estimate_bytes(counts):
+    """Rough in-memory footprint of the ``(key, count)`` pairs."""
+    return sum(item_bytes(key) for key in counts)
+
+
+def exceeds(counts, memory_budget):
+    """Whether the items of ``counts`` are estimated to exceed ``memory_budget``.
+
+    Stops at the first key past the budget, so spilled counts are not read in full.
+    """
+    size = 0
+    for key in counts:
+        size += item_bytes(key)
+        if size > memory_budget:
+            return True
+    return False
+
+
+def write_run(path, items):
+    """Write ``(key, count)`` items to ``path``; returns how many were written."""
+    written = 0
+    with open(path, 'w', encoding='utf-8', newline='\n') as f:
+        for key, count in items:
+            f.write(f"{count}\t{key}\n")
+            written += 1
+    return written
+
+
+def read_run(path):
+    with open(path, encoding='utf-8', newline='\n') as f:
+        for line in f:
+            count, key = line[:-1].split('\t', 1)
+            yield key, int(count)
+
+
+def _sort_items(items, key):
+    """Sort a list of ``(key, count)`` items in place into ``key`` order."""
+    if key is report_key:
+        # Two stable sorts on C-level keys beat one sort on a Python key
+        # (about 30% faster at 2M items)
+        items.sort()
+        items.sort(key=itemgetter(1), reverse=True)
+    else:
+        items.sort(key=key)
+    return items
+
+
+def _sort_run(items, spill_path):
+    write_run(spill_path, _sort_items(items, report_key))
+    return spill_path
+
+
+def _runs(items, run_bytes):
+    """Cut ``items`` into lists of at most ``run_bytes`` estimated bytes each."""
+    run, size = [], 0
+    for item in items:
+        run.append(item)
+        size += item_bytes(item[0])
+        if size >= run_bytes:
+            yield run
+            run, size = [], 0
+    if run:
+        yield run
+
+
+def reduce_runs(paths, merge, directory, fan_in=FAN_IN, keep=FAN_IN):
+    """Merge run files in groups of ``fan_in`` until at most ``keep`` are left.
+
+    ``merge`` maps a list of run paths to the merged ``(key, count)`` items,
+    which are written to new runs in ``directory``; merged inputs are
+    deleted. Returns the remaining paths.
+    """
+    paths = list(paths)
+    merged = 0
+    while len(paths) > keep:
+        groups = [paths[start:start + fan_in] for start in range(0, len(paths), fan_in)]
+        paths = []
+        for group in groups:
+            if len(group) == 1:
+                paths.append(group[0])
+                continue
+            path = os.path.join(directory, f"merged-{merged:05d}.tsv")
+            merged += 1
+            write_run(path, merge(group))
+            for run in group:
+                os.remove(run)
+            paths.append(path)
+    return paths
+
+
+def _merge_report_order(paths):
+    # Merge plain (-count, key) tuples so the heap compares them in C
+    # instead of calling a Python key function per item
+    runs = [((-count, key) for key, count in read_run(path)) for path in paths]
+    for negated, key in heapq.merge(*runs):
+        yield key, -negated
+
+
+def _merge(paths, collated, directory, fan_in):
+    paths = reduce_runs(paths, _merge_report_order, directory, fan_in)
+    for key, count in _merge_report_order(paths):
+        yield (key.rpartition('\0')[2] if collated else key), count
+
+
+def sort_counts(counts, workers=None, memory_budget=None, tmpdir=None, collator=None, fan_in=FAN_IN):
+    """Yield the ``(key, count)`` items of ``counts`` in report order.
+
+    Ties are ordered by ``collator`` (a ``collation.Collator``) when given.
+    ``memory_budget`` is in bytes; when the items are estimated to exceed it,
+    sorted runs are spilled to files under ``tmpdir`` and streamed back
+    during the merge, at most ``fan_in`` at a time. ``workers`` sorts those
+    runs in that many processes; by default they are sorted one after
+    another in this process.
+    """
+    if memory_budget is None or not exceeds(counts, memory_budget):
+        key = report_key if collator is None else collator.report_key
+        yield from _sort_items(list(counts.items()), key)
+        return
+
+    items = counts.items()
+    if collator is not None:
+        items = ((collator.sort_string(key), count) for key, count in items)
+
+    import tempfile  # only needed once counts spill
+    with tempfile.TemporaryDirectory(prefix='sort-runs-', dir=tmpdir) as spill_dir:
+        def spill_path(i):
+            return os.path.join(spill_dir, f"run-{i:05d}.tsv")
+
+        if not workers:
+            runs = [_sort_run(run, spill_path(i)) for i, run in enumerate(_runs(items, memory_budget))]
+        else:
+            from concurrent.futures import ProcessPoolExecutor  # slow import, only needed here
+
+            # Up to `workers` runs are in flight, each held by this process
+            # and by a worker, plus the run being filled
+            run_bytes = max(1, memory_budget // (2 * workers + 1))
+            runs, pending = [], deque()
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                for i, run in enumerate(_runs(items, run_bytes)):
+                    if len(pending) >= workers:
+                        runs.append(pending.popleft().result())
+                    pending.append(pool.submit(_sort_run, run, spill_path(i)))
+                runs.extend(future.result() for future in pending)
+        yield from _merge(runs, collator is not None, spill_dir, fan_in)
@@ -1,1041 +1,312 @@
-# Input data (paste the list between the triple quotes)
-data = """
-Italian Amarone
-South African Chenin Blanc
-Burgundy Côte de Beaune White
-Burgundy Côte de Nuits Red
-Burgundy Côte de Beaune Red
-Central Italy White
-Bordeaux Libournais Red
-German Riesling
-French Champagne
-Burgundy Chablis
-Burgundy Côte de Nuits Red
-Burgundy Côte de Nuits Red
-Californian Sonoma Coast Pinot Noir Red
-Bordeaux Margaux
-Napa Valley Bordeaux Blend
-Bordeaux Margaux
-Bordeaux Pauillac
-Californian Sauvignon Blanc
-Burgundy White
-Oregon Pinot Noir
-Spanish Rioja White
-Burgundy Côte de Nuits Red
-Italian Montepulciano d'Abruzzo
-Italian Barolo
-Southern Rhône Châteauneuf-du-Pape Red
-Burgundy White
-Burgundy Côte de Beaune White
-Austrian Riesling
-Spanish Rosé
-Burgundy Côte de Beaune Red
-Burgundy Côte de Nuits Red
-Italian Barolo
-Burgundy Côte de Nuits Red
-Lebanese White
-Californian Pinot Noir
-Burgundy Côte de Nuits Red
-French Champagne
-Californian Rhône Blend Red
-Loire Chenin Blanc
-Californian Sparkling
-French Champagne
-Burgundy Red
-Burgundy Côte de Nuits Red
-Northern Rhône Cornas
-Burgundy Chablis
-Bordeaux Haut-Médoc Red
-Australian Viognier
-Burgundy Côte de Nuits Red
-Burgundy Côte de Nuits Red
-Burgundy Côte de Beaune White
-Spanish Sparkling
-Northern Rhône Saint-Joseph
-Burgundy Côte de Beaune White
-Burgundy Côte de Nuits Red
-Burgundy Côte de Beaune Red
-Burgundy Côte de Beaune White
-Burgundy Côte de Nuits Red
-Colheita Port
-Bordeaux Sauternes
-Southern Rhône White
-French Loire Chenin Blanc Dessert
-Burgundy White
-Californian Red Blend
-Burgundy Côte de Nuits Red
-French Champagne
-Burgundy Côte de Nuits Red
-Spanish Rhône Blend Red
-French Champagne
-Southern Rhône Red
-Burgundy Chablis
-Californian Chardonnay
-Californian Cabernet Sauvignon
-Burgundy White
-Northern Rhône White
-Greek Nemea Red
-Argentinian Mendoza Malbec Red
-Northern Rhône Côte-Rotie
-Burgundy Red
-Burgundy Côte de Nuits Red
-Bordeaux Pauillac
-Napa Valley Cabernet Sauvignon
-Bordeaux White
-Single Quinta Vintage Port
-Languedoc-Roussillon Red
-Burgundy Chablis
-Burgundy Côte de Nuits Red
-French Champagne
-German Riesling
-Spanish Rioja Red
-Burgundy Côte de Nuits Red
-Burgundy Côte de Nuits Red
-Napa Valley Cabernet Sauvignon
-Spanish Manzanilla Sherry Fortified
-Jura Vin Jaune
-Burgundy Red
-Napa Valley Cabernet Sauvignon
-Napa Valley Cabernet Sauvignon
-Italian Barolo
-Bordeaux Saint-Julien
-Southern Rhône Châteauneuf-du-Pape Red
-French Champagne
-Northern Rhône White
-Northern Rhône Condrieu
-Burgundy White
-Northern Rhône Saint-Joseph
-Northern Rhône White
-French White
-Northern Rhône Cornas
-Burgundy Côte de Beaune White
-Burgundy Côte de Beaune White
-Burgundy Côte de Beaune Red
-Bordeaux Red
-Burgundy Côte de Beaune White
-Napa Valley Cabernet Sauvignon
-Napa Valley Cabernet Sauvignon
-Burgundy Côte de Nuits Red
-Burgundy Côte de Beaune Red
-Napa Valley Bordeaux Blend
-Burgundy Côte de Beaune White
-Spanish Grenache
-Californian Zinfandel
-Burgundy Côte de Nuits Red
-Burgundy Côte de Beaune White
-Italian Brunello
-Burgundy Côte de Nuits Red
-Austrian Riesling
-French Champagne
-Burgundy Côte de Beaune White
-Burgundy Côte de Nuits Red
-Burgundy Côte de Beaune White
-Burgundy Côte de Nuits Red
-Californian Sonoma Coast Pinot Noir Red
-Burgundy Côte de Beaune Red
-Loire Muscadet
-Northern Rhône Crozes-Hermitage
-Burgundy Côte de Beaune White
-Californian Rosé
-Burgundy Côte de Nuits Red
-Burgundy Côte de Nuits Red
-Upper Loire Red
-Burgundy Côte de Beaune Red
-Tuscan Red
-Burgundy White
-Italian Barolo
-Provence Rosé
-Napa Valley Cabernet Sauvignon
-Burgundy Côte de Beaune White
-French Champagne
-Napa Valley Cabernet Sauvignon
-Burgundy Red
-Bordeaux Margaux
-Northern Rhône Côte-Rotie
-Burgundy Côte de Nuits Red
-French Champagne
-French Champagne
-Central Italy Red
-Californian Zinfandel
-Burgundy Côte de Nuits Red
-Burgundy Côte de Beaune White
-Spanish Fino Sherry Fortified
-Oregon Chardonnay
-Burgundy Chablis
-Burgundy Red
-German Spätburgunder
-Northern Italy White
-Californian Anderson Valley Pinot Noir Red
-Burgundy Côte de Nuits Red
-Burgundy Côte de Nuits Red
-Northern Italy White
-Napa Valley Cabernet Sauvignon
-Burgundy Côte de Nuits Red
-Burgundy Côte de Beaune White
-Italian Brunello
-Bordeaux Sauternes
-Bordeaux Red
-Burgundy Côte de Beaune White
-Burgundy Côte de Nuits Red
-Greek Nemea Red
-Burgundy Côte de Beaune Red
-Burgundy Chablis
-French Languedoc-Roussillon Fortified
-Burgundy Côte de Nuits Red
-French Méditerranée White
-Italian Chianti Classico Red
-South Australia Grenache Red
-Burgundy Red
-Californian Zinfandel
-French Champagne
-Northern Rhône Côte-Rotie
-Burgundy Côte de Beaune White
-Burgundy Côte de Beaune Red
-Alsace Riesling
-Burgundy Côte de Beaune Red
-Burgundy Côte de Beaune Red
-Northern Rhône White
-Burgundy Côte de Nuits Red
-Burgundy Côte de Nuits Red
-French Champagne
-Burgundy Côte de Nuits Red
-French Champagne
-Bordeaux Saint-Julien
-Burgundy White
-Bordeaux Margaux
-Spanish Ribera Del Duero Red
-Bordeaux Pauillac
-Burgundy Côte de Beaune White
-French Champagne
-Spanish Priorat Red
-Burgundy Côte de Nuits Red
-Bordeaux Sauternes
-Italian Chianti Classico Red
-Burgundy Côte de Beaune White
-Burgundy Côte de Nuits Red
-Southern Italy Red
-South Australia Shiraz
-Bordeaux Pessac-Léognan
-French Loire Rosé
-Napa Valley Cabernet Sauvignon
-Californian Sta. Rita Hills Pinot Noir Red
-Australian Hunter Valley Sémillon White
-Australian Rhône Blend Red
-Burgundy Côte de Nuits Red
-Washington Red
-Oregon Chardonnay
-Spanish Rioja White
-Burgundy Côte de Nuits Red
-Burgundy Côte de Nuits Red
-Central Italy Red
-Californian Russian River Valley Pinot Noir Red
-Languedoc-Roussillon Red
-Burgundy Côte de Nuits Red
-Burgundy Côte de Beaune Red
-Italian Franciacorta Sparkling
-Burgundy Côte de Beaune White
-Burgundy Côte de Nuits Red
-French Provence Red
-Alsace Riesling
-Italian Barolo
-Alsace Riesling
-French Loire Chenin Blanc Dessert
-French Champagne
-Spanish White
-Burgundy Côte de Beaune Red
-Italian Bolgheri
-Jura White
-Burgundy Côte de Beaune Red
-Southern Rhône Red
-Bordeaux Saint-Julien
-Burgundy Côte de Beaune Red
-Californian Chardonnay
-Oregon Pinot Noir
-Burgundy Côte de Nuits Red
-Burgundy Côte de Beaune White
-Bordeaux Saint-Émilion
-Languedoc-Roussillon Red
-Macvin
-Burgundy Côte de Nuits Red
-Burgundy Côte de Beaune Red
-Burgundy Côte de Beaune Red
-French Champagne
-Spanish Priorat Red
-Burgundy Côte de Nuits Red
-Burgundy Côte de Nuits Red
-Languedoc-Roussillon White
-Oregon Pinot Noir
-Napa Valley Cabernet Sauvignon
-Macvin
-Burgundy Côte de Beaune White
-French Champagne
-French Champagne
-Burgundy Chablis
-Italian Chianti
-Burgundy Côte de Nuits Red
-Burgundy Côte de Nuits Red
-French Champagne
-Burgundy Côte de Beaune White
-Burgundy Côte de Nuits Red
-Californian Chardonnay
-French Champagne
-Burgundy Côte de Nuits Red
-Austrian Rosé
-Burgundy Chablis
-French Champagne
-Northern Rhône Côte-Rotie
-Burgundy Côte de Nuits Red
-French Champagne
-South African Chenin Blanc
-Northern Rhône White
-Burgundy Côte de Nuits Red
-Burgundy Côte de Beaune White
-Australian Chardonnay
-French Champagne
-Italian Nebbiolo
-Burgundy Côte de Nuits Red
-Jura White
-Burgundy Côte de Beaune Red
-French Champagne
-Bordeaux Pomerol
-German Riesling
-Bordeaux Pomerol
-Burgundy Côte de Beaune White
-Burgundy Côte de Nuits Red
-Upper Loire White
-Burgundy Côte de Beaune White
-Italian Bolgheri
-Central Italy White
-Burgundy Côte de Nuits Red
-Oregon Pinot Noir
-Burgundy Côte de Nuits Red
-Burgundy Côte de Beaune White
-Languedoc-Roussillon Red
-Burgundy Côte de Nuits Red
-French Provence Red
-Bordeaux Pauillac
-Burgundy Côte de Beaune Red
-Burgundy Côte de Beaune White
-Burgundy Côte de Beaune Red
-French Comtés Rhodaniens Red
-Australian Merlot
-Burgundy Côte de Beaune White
-Burgundy Côte de Beaune Red
-French Champagne
-Burgundy Côte de Nuits Red
-Burgundy Côte de Beaune Red
-Californian Sonoma Coast Pinot Noir Red
-Burgundy Côte de Nuits Red
-Burgundy Côte de Nuits Red
-Californian Santa Lucia Highlands Pinot Noir Red
-Alsace Riesling
-German Riesling
-French Middle Loire Cabernet Franc Red
-Beaujolais Red
-Portuguese Madeira
-Burgundy Côte de Nuits Red
-Burgundy Côte de Nuits Red
-Burgundy Côte Chalonnaise White
-French Champagne
-Napa Valley Cabernet Sauvignon
-French Champagne
-Provence Rosé
-Washington State Cabernet Sauvignon
-Burgundy Côte de Beaune Red
-Southern Rhône Red
-Spanish Red
-French Middle Loire Cabernet Franc Red
-Bordeaux Pauillac
-French Champagne
-Alsace Riesling
-Burgundy Côte de Nuits Red
-Burgundy Côte de Beaune Red
-Bordeaux Saint-Émilion
-Bordeaux Red
-Burgundy Côte de Nuits Red
-Burgundy Chablis
-Napa Valley Cabernet Sauvignon
-Italian Red
-Burgundy Côte de Beaune White
-Napa Valley Cabernet Sauvignon
-Burgundy Côte Chalonnaise White
-Bordeaux Pauillac
-Burgundy White
-Bordeaux Saint-Estèphe
-Northern Rhône Hermitage
-Californian Grenache Red
-French Champagne
-Burgundy Côte de Nuits Red
-French Champagne
-Northern Italy White
-Spanish Albariño
-Napa Valley Cabernet Sauvignon
-Californian Zinfandel
-Beaujolais Red
-Southern Rhône Châteauneuf-du-Pape Red
-Burgundy Côte de Nuits Red
-Californian Syrah
-Washington State Sauvignon Blanc
-Burgundy Côte de Beaune White
-Californian Santa Barbara County Chardonnay White
-Californian Russian River Valley Pinot Noir Red
-French Champagne
-Italian Valpolicella Red
-French Champagne
-Burgundy Côte de Nuits Red
-Italian Barolo
-Burgundy Côte de Nuits Red
-Australian Pinot Noir
-Californian Rhône Blend Red
-Californian Syrah
-Napa Valley Cabernet Sauvignon
-Californian Sparkling
-Burgundy White
-Austrian Riesling
-German Riesling
-Loire Chenin Blanc
-Burgundy Côte de Beaune White
-Burgundy Côte de Nuits Red
-Napa Valley Cabernet Sauvignon
-Burgundy Côte de Beaune White
-French Champagne
-Burgundy Côte de Nuits Red
-Northern Rhône Cornas
-Burgundy Côte de Nuits Red
-Tuscan Red
-Southern Italy Red
-Southern Rhône White
-Northern Rhône Saint-Joseph
-Burgundy Côte de Beaune Red
-Spanish Rioja White
-Northern Rhône Saint-Joseph
-Californian Sonoma Coast Pinot Noir Red
-Californian Sonoma Coast Pinot Noir Red
-Austrian Grüner Veltliner
-Italian Barolo
-Californian Syrah
-Californian White
-Californian Sonoma Coast Pinot Noir Red
-French Champagne
-French Champagne
-Napa Valley Bordeaux Blend
-Napa Valley Cabernet Sauvignon
-Burgundy Côte de Beaune White
-Burgundy Côte de Nuits Red
-Burgundy Côte de Beaune White
-Northern Rhône White
-Bordeaux Saint-Julien
-Burgundy Côte de Nuits Red
-Burgundy White
-Burgundy Côte de Beaune Red
-Lebanese Red
-Spanish Grenache
-Burgundy Côte de Nuits Red
-Californian Sonoma Coast Pinot Noir Red
-Greek Red
-California Red
-French Champagne
-Burgundy Côte de Beaune Red
-Californian Sauvignon Blanc
-Burgundy Côte de Nuits Red
-Californian Alexander Valley Cabernet Sauvignon Red
-Oregon Pinot Noir
-Burgundy Côte de Beaune Red
-Californian Sauvignon Blanc
-Burgundy Côte de Nuits Red
-Burgundy Côte de Beaune White
-Southwest France Malbec
-Burgundy Côte de Nuits Red
-Burgundy Côte de Nuits Red
-Southern Italy Red
-German Riesling
-Burgundy Côte de Beaune White
-Upper Loire White
-French Middle Loire Cabernet Franc Red
-Provence Rosé
-Californian Sauvignon Blanc
-Californian Russian River Valley Chardonnay White
-Italian Barbaresco
-Burgundy Côte de Beaune White
-French White
-Northern Italy Pinot Grigio
-Californian Anderson Valley Pinot Noir Red
-Burgundy Côte de Beaune Red
-Australian Adelaide Hills Shiraz
-Portuguese Douro Red
-Californian Merlot
-Bordeaux Pomerol
-Burgundy Côte de Nuits Red
-Napa Valley Cabernet Sauvignon
-Californian Zinfandel
-Napa Valley Chardonnay
-Burgundy Côte de Nuits Red
-French Champagne
-French Champagne
-Burgundy Chablis
-Austrian Riesling
-Burgundy Côte de Nuits Red
-Napa Valley Bordeaux Blend
-Burgundy Côte de Nuits Red
-Northern Rhône Saint-Joseph
-Burgundy Côte de Beaune White
-Napa Valley Cabernet Sauvignon
-Burgundy Côte de Beaune White
-Jura White
-Provence Rosé
-Burgundy Côte de Nuits Red
-Burgundy Côte de Beaune White
-French Champagne
-Californian Bordeaux Blend
-Northern Rhône Côte-Rotie
-Oregon Pinot Noir Rosé
-Burgundy Côte de Nuits Red
-Californian Russian River Valley Chardonnay White
-Port
-Greek Red
-Italian Montepulciano d'Abruzzo
-White Port
-Napa Valley Chardonnay
-French Champagne
-South African Chenin Blanc
-Languedoc-Roussillon Red
-Austrian Riesling
-French Champagne
-Californian Santa Barbara County Chardonnay White
-Portuguese Douro Red
-Alsace Pinot Gris
-Central Italy White
-Southern Rhône White
-French Champagne
-Spanish Cava
-French Champagne
-South Australia Shiraz
-German Riesling
-Californian Sonoma Coast Pinot Noir Red
-Burgundy Côte de Beaune White
-Burgundy White
-Bordeaux Red
-Italian Brunello
-Argentinian Syrah
-Australian Cabernet - Shiraz
-Burgundy Côte de Beaune Red
-Napa Valley Cabernet Sauvignon
-Californian Cabernet Sauvignon
-Burgundy Côte de Nuits Red
-Burgundy Côte de Beaune Red
-Burgundy Côte de Nuits Red
-Californian Alexander Valley Cabernet Sauvignon Red
-Burgundy Côte de Beaune White
-Burgundy Côte de Beaune White
-Burgundy Côte de Nuits Red
-Northern Rhône Saint-Joseph
-Spanish Ribera Del Duero Red
-Burgundy Côte de Nuits Red
-Bordeaux Pomerol
-French Champagne
-Napa Valley Cabernet Sauvignon
-Burgundy Côte de Beaune Red
-Burgundy Côte de Nuits Red
-Burgundy Mâconnais White
-Argentinian Chardonnay
-Burgundy Côte de Nuits Red
-Burgundy Côte de Nuits Red
-Australian Pinot Noir
-Napa Valley Cabernet Sauvignon
-Burgundy Côte de Nuits Red
-Burgundy Côte de Beaune White
-French Champagne
-Burgundy Côte de Beaune White
-French Champagne
-Bordeaux Saint-Estèphe
-Northern Italy Red
-Southern Rhône Châteauneuf-du-Pape Red
-Californian Sta. Rita Hills Pinot Noir Red
-Burgundy Mâconnais White
-French Red
-French Champagne
-Northern Italy White
-Burgundy White
-Burgundy Côte de Nuits Red
-Burgundy Côte de Nuits Red
-Oregon Pinot Noir
-Burgundy Côte de Nuits Red
-Tawny Port
-Burgundy Côte de Beaune White
-Italian Barbera
-Burgundy Côte de Beaune White
-Burgundy White
-Burgundy Côte de Nuits Red
-Languedoc-Roussillon Red
-Burgundy Côte de Nuits Red
-Burgundy Côte de Nuits Red
-Burgundy Côte de Beaune Red
-Burgundy Côte de Nuits Red
-Spanish Priorat Red
-Oregon Pinot Noir
-Beaujolais Red
-Greek
-Southern Rhône Châteauneuf-du-Pape Red
-Burgundy Côte de Beaune Red
-German Riesling
-Burgundy Côte de Nuits Red
-Southern Rhône Châteauneuf-du-Pape Red
-French Champagne
-Californian Santa Barbara County Chardonnay White
-Burgundy Côte de Nuits Red
-Burgundy Côte de Nuits Red
-Argentinian Red
-Burgundy Côte de Nuits Red
-Napa Valley Cabernet Sauvignon
-French Red
-French Champagne
-French Champagne
-Burgundy Côte de Beaune White
-Burgundy Côte de Beaune White
-Napa Valley Chardonnay
-Burgundy Côte de Nuits Red
-Italian Bolgheri
-Central Italy White
-Upper Loire White
-South African Dessert
-Burgundy Côte de Beaune Red
-Italian Barbaresco
-Burgundy Côte de Beaune White
-Italian Barbera
-Californian Merlot
-French Champagne
-Burgundy Côte de Nuits Red
-Northern Rhône Cornas
-French Middle Loire Cabernet Franc Red
-Napa Valley Chardonnay
-Italian Barbaresco
-Burgundy White
-Italian Bolgheri
-Burgundy Côte de Beaune White
-Burgundy Côte de Nuits Red
-Bordeaux Saint-Julien
-Beaujolais Red
-Central Italy White
-Spanish Grenache
-French Sparkling
-Southern Rhône Red
-Burgundy Red
-Burgundy Côte de Beaune White
-Austrian Grüner Veltliner
-Burgundy Côte de Beaune White
-Loire Chenin Blanc
-Californian Sonoma Coast Chardonnay White
-French Bordeaux Rosé
-Burgundy Côte de Nuits Red
-Californian Bordeaux Blend
-Californian Pinot Noir
-Napa Valley Cabernet Sauvignon
-Burgundy Côte de Nuits Red
-Burgundy Côte de Nuits Red
-French Champagne
-Burgundy White
-Washington State Merlot
-Spanish Rioja Red
-Tuscan Red
-Southern Italy Red
-Spanish Fino Sherry Fortified
-Northern Rhône Saint-Joseph
-Californian Sta. Rita Hills Pinot Noir Red
-Spanish Priorat Red
-Southern Rhône Red
-Spanish Sparkling
-French White
-Burgundy Côte de Beaune White
-French Champagne
-Burgundy Côte de Beaune Red
-Burgundy Côte de Beaune White
-Burgundy Côte de Nuits Red
-Burgundy Côte de Beaune Red
-Italian Amarone
-Tawny Port
-Italian Barbaresco
-Oregon Pinot Noir
-Burgundy Côte de Beaune White
-Burgundy Côte de Nuits Red
-Burgundy Chablis
-Burgundy Côte de Nuits Red
-Burgundy Côte de Nuits Red
-Northern Italy White
-Jura White
-Burgundy Côte de Nuits Red
-Tuscan Red
-Spanish Rioja Red
-Bordeaux Sauternes
-Californian Sauvignon Blanc
-Burgundy Côte de Beaune White
-Burgundy Red
-Argentinian Uco Valley Malbec Red
-Burgundy Côte de Beaune White
-Burgundy Côte de Nuits Red
-Bordeaux White
-Burgundy Côte de Beaune Red
-Burgundy Côte de Nuits Red
-Bordeaux Saint-Estèphe
-French Champagne
-Burgundy Côte de Beaune Red
-Bordeaux Saint-Julien
-New Zealand Chardonnay
-Burgundy Mâconnais White
-Burgundy Côte de Nuits Red
-Burgundy Côte de Beaune Red
-Burgundy Côte de Beaune Red
-Burgundy Côte de Beaune White
-Burgundy White
-Southern Rhône White
-French Champagne
-German Spätburgunder
-Bordeaux Sauternes
-Burgundy Côte de Beaune Red
-Burgundy Côte de Nuits Red
-Californian Syrah
-Central Italy White
-Texas Red
-Bordeaux Saint-Émilion
-South African Pinot Noir
-Spanish Rioja Red
-Burgundy Côte de Nuits Red
-Mexican Rose
-Italian Barolo
-Tuscan Red
-Burgundy Côte de Nuits Red
-Burgundy Côte de Nuits Red
-Oregon Pinot Noir
-Napa Valley Cabernet Sauvignon
-French Sparkling
-Burgundy Côte de Nuits Red
-Portuguese Douro Red
-Burgundy Côte de Beaune White
-Napa Valley Cabernet Sauvignon
-Californian Rosé
-Beaujolais Red
-French Champagne
-New Zealand Chardonnay
-Burgundy Côte de Nuits Red
-Burgundy Côte de Beaune White
-Bordeaux Pomerol
-Napa Valley Cabernet Sauvignon
-Tuscan Red
-Burgundy Côte de Nuits Red
-Lebanese Red
-South African Cinsault Red
-French Champagne
-Burgundy Côte Chalonnaise Red
-Burgundy Côte de Nuits Red
-Spanish Mencia
-Languedoc-Roussillon Red
-French Comtés Rhodaniens Red
-Spanish Rioja Red
-Southern Rhône White
-Northern Italy White
-Northern Rhône Saint-Joseph
-Bordeaux Saint-Émilion
-Spanish Cava
-French Champagne
-Californian Sonoma County Cabernet Sauvignon Red
-Burgundy Côte de Beaune White
-Californian Red Blend
-German Riesling
-Lebanese Red
-Burgundy Côte de Beaune White
-Napa Valley Cabernet Sauvignon
-Californian Sonoma Coast Chardonnay White
-Californian Russian River Valley Chardonnay White
-Italian Bolgheri
-Northern Rhône Côte-Rotie
-Burgundy Côte de Beaune White
-South African White
-Burgundy Côte de Nuits Red
-Burgundy Côte de Nuits Red
-Burgundy Côte de Beaune Red
-Austrian Blaufränkisch
-Burgundy Côte de Nuits Red
-Burgundy Côte de Nuits Red
-French Champagne
-French Red
-Burgundy Red
-Burgundy White
-French Champagne
-Burgundy Côte de Beaune White
-Burgundy Côte de Beaune White
-Californian Sonoma County Cabernet Sauvignon Red
-Northern Rhône Cornas
-Burgundy Côte de Nuits Red
-Italian Bolgheri
-Northern Rhône Cornas
-Burgundy Côte de Beaune Red
-Provence Rosé
-Burgundy Côte de Beaune White
-French Provence Red
-Southern Rhône Red
-Californian Alexander Valley Cabernet Sauvignon Red
-Bordeaux Saint-Julien
-Burgundy White
-Loire Chenin Blanc
-Bordeaux Pessac-Léognan
-Burgundy Côte de Nuits Red
-French Champagne
-Burgundy Côte de Nuits Red
-Napa Valley Cabernet Sauvignon
-Burgundy Côte de Nuits Red
-French White
-Californian Red Blend
-French Jura Red
-Californian Sta. Rita Hills Pinot Noir Red
-Burgundy Chablis
-Burgundy Côte de Beaune White
-Bordeaux Saint-Julien
-Champagne
-Alsace Riesling
-Burgundy Côte de Nuits Red
-Napa Valley Cabernet Sauvignon
-Burgundy Côte de Nuits Red
-Californian Sonoma County Cabernet Sauvignon Red
-Californian Sonoma Coast Chardonnay White
-Northern Italy Pinot Blanc
-Burgundy Côte de Beaune White
-Californian Sauvignon Blanc
-Burgundy Côte de Nuits Red
-French Loire Chenin Blanc Dessert
-French Corsica Red
-South African Red
-Burgundy Côte de Nuits Red
-French Champagne
-Burgundy Côte de Nuits Red
-South Australia Grenache Red
-Austrian Riesling
-Loire Touraine Sauvignon Blanc
-Burgundy Côte de Beaune Red
-Australian McLaren Vale Shiraz
-Burgundy Côte de Beaune White
-Burgundy Red
-German Riesling
-Burgundy Côte de Nuits Red
-French Rosé
-Burgundy Côte de Nuits Red
-Spanish Red
-Italian Barolo
-Burgundy White
-Burgundy Côte de Beaune White
-German Riesling
-Burgundy Côte de Nuits Red
-Burgundy Côte de Beaune Red
-Californian Syrah
-Burgundy Côte de Nuits Red
-Burgundy Côte de Nuits Red
-Burgundy Côte de Nuits Red
-Burgundy Côte de Beaune White
-Burgundy Côte de Nuits Red
-French Champagne
-Burgundy Côte de Nuits Red
-Australian Cabernet Sauvignon
-Burgundy Côte de Nuits Red
-Bordeaux Pauillac
-Bordeaux Saint-Émilion
-Burgundy Côte de Beaune White
-Burgundy Côte de Beaune White
-Greek Red
-Argentinian Mendoza Malbec Red
-Upper Loire White
-Spanish Rioja Red
-Australian Rosé
-Burgundy Côte de Nuits Red
-Languedoc-Roussillon White
-Burgundy Côte de Beaune White
-French Champagne
-Californian Grenache Red
-French Alsace Gewürztraminer Dessert
-Northern Rhône Hermitage
-Lebanese Red
-French Rosé
-Burgundy Côte de Beaune White
-Washington State Cabernet Sauvignon
-Napa Valley Cabernet Sauvignon
-Northern Rhône Condrieu
-Burgundy Côte de Nuits Red
-French Champagne
-Burgundy Côte de Beaune White
-Burgundy Côte de Nuits Red
-German Spätburgunder
-Burgundy Côte de Nuits Red
-Burgundy Mâconnais White
-Northern Rhône White
-Napa Valley Cabernet Sauvignon
-Napa Valley Cabernet Sauvignon
-Burgundy Côte de Nuits Red
-Burgundy Côte de Beaune White
-Languedoc-Roussillon Rosé
-French Champagne
-French Champagne
-Upper Loire Red
-Oregon Cabernet Franc Red
-Burgundy Red
-Argentinian Uco Valley Malbec Red
-Northern Rhône Saint-Joseph
-Californian Chardonnay
-French Champagne
-Californian Sauvignon Blanc
-Californian Paso Robles Cabernet Sauvignon Red
-German Riesling
-Bordeaux White
-Burgundy Côte de Beaune White
-Bordeaux Pomerol
-Australian Pinot Noir
-Burgundy Côte de Beaune White
-Burgundy Côte de Beaune White
-French Sparkling
-Oregon Chardonnay
-Jura White
-South African Chardonnay
-Italian Montepulciano d'Abruzzo
-Beaujolais Red
-Northern Rhône Côte-Rotie
-Californian Red Blend
-South Australia Grenache Red
-French Champagne
-Californian Cabernet Sauvignon
-Burgundy Côte de Nuits Red
-Alsace Riesling
-Southern Rhône Red
-Burgundy Côte de Nuits Red
-Italian Prosecco
-Italian Amarone
-Californian Chardonnay
-Burgundy Côte de Nuits Red
-Spanish Ribera Del Duero Red
-Burgundy Côte de Nuits Red
-Californian Sonoma Coast Pinot Noir Red
-Napa Valley Cabernet Sauvignon
-French Champagne
-Portuguese Vinho Verde White
-Californian Merlot
-French Champagne
-Northern Rhône Crozes-Hermitage
-Bordeaux Pauillac
-Bordeaux Pessac-Léognan
-Burgundy Côte de Beaune Red
-Italian Montepulciano d'Abruzzo
-Oregon Pinot Noir
-Burgundy Côte de Nuits Red
-Bordeaux Sauternes
-Burgundy Côte de Beaune White
-Californian Sonoma Coast Pinot Noir Red
-Burgundy Côte de Nuits Red
-Tuscan Red
-Italian Barolo
-Burgundy Côte Chalonnaise White
-White Port
-Burgundy Mâconnais White
-Italian Sparkling
-Argentinian Uco Valley Malbec Red
-Provence Rosé
-Napa Valley Bordeaux Blend
-French Champagne
-Australian Pinot Noir
-Burgundy Côte de Beaune White
-Burgundy Côte de Nuits Red
-Californian Merlot
-French Champagne
-Spanish Grenache
-Burgundy Côte de Beaune White
-Bordeaux Margaux
-French Champagne
-Beaujolais Red
-Burgundy Côte de Nuits Red
-Beaujolais Red
-Tuscan Red
-French Provence Red
-Beaujolais Red
-French Champagne
-Burgundy Côte de Beaune White
-Californian Rosé
-Northern Rhône Côte-Rotie
-Provence Rosé
-Burgundy Red
-Bordeaux Saint-Julien
-Napa Valley Chardonnay
-Napa Valley Cabernet Sauvignon
-Burgundy Côte de Nuits Red
-Californian Syrah
-Burgundy Chablis
-Bordeaux Saint-Estèphe
-Austrian Grüner Veltliner
-Burgundy Côte de Beaune Red
-Oregon Pinot Noir
-Bordeaux Saint-Julien
-Burgundy Côte de Nuits Red
-Burgundy Côte de Beaune Red
-Southern Rhône Châteauneuf-du-Pape Red
-French Champagne
-Oregon Viognier White
-Southern Italy Red
-Californian White
-Napa Valley Cabernet Sauvignon
-Burgundy Côte de Beaune Red
-Australian Hunter Valley Sémillon White
-Burgundy Côte de Nuits Red
-Burgundy Côte de Nuits Red
-Burgundy Côte de Beaune White
-French White
-Spanish White
-Champagne
-Bordeaux Sauternes
-Oregon White
-Italian Montepulciano d'Abruzzo
-Spanish Cava
-French Loire Rosé
-Burgundy Red
-Burgundy Côte de Beaune Red
-Californian Bordeaux Blend
-French Champagne
-Burgundy Côte de Nuits Red
-Australian Barossa Valley Shiraz
-Burgundy Côte de Nuits Red
-Austrian Grüner Veltliner
-Languedoc-Roussillon White
-French Loire Rosé
-French Champagne
-Italian Montepulciano d'Abruzzo
-Spanish Montsant Red
-Northern Rhône Condrieu
-Bordeaux Pomerol
-Californian Santa Barbara County Chardonnay White
-Burgundy Côte de Beaune White
-German Riesling
-Italian Red
-Northern Rhône Côte-Rotie
-Burgundy White
-Californian Santa Lucia Highlands Pinot Noir Red
-Burgundy Côte de Nuits Red
-Burgundy Côte de Nuits Red
-French Champagne
-French Méditerranée Red
-Californian Red Blend
-Austrian Riesling
-Burgundy Côte de Nuits Red
-"""
+import argparse
+import os
+from collections import Counter
+from itertools import islice
 
-# Process the data
-regions = [line.strip() for line in data.split('\n') if line.strip()]
-total = len(regions)
-unique_regions = set(regions)
-unique_count = len(unique_regions)
+from decompress import iter_lines
+from extsort import report_key, sort_counts
 
-# Count occurrences
-from collections import Counter
-region_counts = Counter(regions)
+# The feature modules are imported in the branches that use them, so a plain
+# count starts as fast as the original script
+
+# Default input: the club's region list, one label per line
+DEFAULT_INPUT = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures', 'regions.txt')
+
+# Options each alternative report mode honors, in the order main() checks
+# the modes; any other option given with a mode is rejected, not ignored
+MODE_OPTIONS = {
+    'snapshot': {'top'},
+    'merge_summaries': {'top', 'collate', 'memory_budget', 'sort_workers'},
+    'vintages': {'paths', 'normalize', 'collate', 'top', 'by_decade', 'vintage_range', 'region'},
+    'pairs': {'paths', 'normalize'},
+    'sample': {'paths', 'normalize', 'stratify', 'patience', 'seed', 'top'},
+}
+
+# Options that only mean something alongside another one
+REQUIRES = {
+    'resume': 'checkpoint',
+    'checkpoint_every': 'checkpoint',
+    'by_decade': 'vintages',
+    'vintage_range': 'vintages',
+    'region': 'vintages',
+    'stratify': 'sample',
+    'patience': 'sample',
+    'seed': 'sample',
+    'source': 'write_summary',
+    'sketch_width': 'write_summary',
+    'vector_labels': 'vectors',
+    'sort_workers': 'memory_budget',
+    'similarity': 'vectors',
+}
+
+
+def split_records(lines, normalizer=None):
+    """Yield ``(key, region)`` from ``key<TAB>region`` lines, skipping blank regions.
+
+    Fields are split before ``normalizer`` runs, so it only rewrites the region.
+    """
+    for line in lines:
+        key, _, region = line.rpartition('\t')
+        if normalizer is not None:
+            region = normalizer.clean(region)
+        region = region.strip()
+        if region:
+            yield key.strip(), region
+
+
+def _option(dest):
+    return 'input files' if dest == 'paths' else '--' + dest.replace('_', '-')
+
+
+def check_options(parser, args):
+    """Reject options that the selected mode would silently ignore."""
+    given = [
+        dest for dest, value in vars(args).items()
+        if value not in (None, False, []) and value != parser.get_default(dest)
+    ]
+    for dest in given:
+        needed = REQUIRES.get(dest)
+        if needed and needed not in given:
+            parser.error(f"{_option(dest)} needs {_option(needed)}")
+    for mode, allowed in MODE_OPTIONS.items():
+        if mode in given:
+            ignored = [dest for dest in given if dest != mode and dest not in allowed]
+            if ignored:
+                parser.error(f"{_option(mode)} cannot be combined with {', '.join(map(_option, ignored))}")
+            break
+
+
+def print_report(total, unique_count, sorted_counts):
+    print(f"Total quantity: {total}")
+    print(f"Number of unique regions: {unique_count}\n")
+    for region, count in sorted_counts:
+        print(f"{region}: {count}")
+
+
+def print_estimates(estimator, stopped, top=None):
+    seen = estimator.seen
+    if stopped:
+        print(f"Sampled preview: stopped early after the first {seen} lines (top ranking stable), {estimator.strata} strata")
+    else:
+        print(f"Sampled preview: full scan of {seen} lines, {estimator.strata} strata")
+    print(f"Reservoir size per stratum: {estimator.size}\n")
+    # After an early stop, shares (with uncorrected intervals) describe the
+    # whole input; counts only cover the lines read
+    scope = f" within the first {seen} lines" if stopped else ""
+    for region, estimate, low, high in islice(estimator.estimates(finite=not stopped), top):
+        print(f"{region}: {estimate / seen:.1%} (95% CI {low / seen:.1%}-{high / seen:.1%}), ~{estimate:.0f} bottles{scope}")
+
+
+def print_vintages(vintages, regions, vintage_range, by_decade, top, order):
+    totals = vintages.totals()
+    non_vintage = sum(histogram.non_vintage for histogram in vintages.regions.values())
+    print(f"Total quantity: {sum(totals.values())} ({non_vintage} non-vintage)")
+    print(f"Number of unique regions: {len(totals)}\n")
+    if regions:
+        totals = {region: totals.get(region, 0) for region in regions}
+    for region, count in islice(sorted(totals.items(), key=order), top):
+        histogram = vintages.regions.get(region)
+        if vintage_range and histogram:
+            low, high = vintage_range
+            print(f"{region}: {histogram.range_count(low, high)} of {count} from {low}-{high}")
+        else:
+            print(f"{region}: {count}")
+        if by_decade and histogram:
+            for decade, decade_count in histogram.by_decade():
+                print(f"  {decade}s: {decade_count}")
+            if histogram.non_vintage:
+                print(f"  NV: {histogram.non_vintage}")
+
+
+def print_distribution(stats):
+    print("\nDistribution:")
+    for level, regions in stats['coverage'].items():
+        print(f"Regions covering {level:.0%} of bottles: {regions}")
+    print(f"Gini coefficient: {stats['gini']:.3f}")
+    print(f"Entropy: {stats['entropy']:.3f} bits (normalized {stats['normalized_entropy']:.3f})")
+    print("Count histogram (log2 buckets):")
+    for low, high, regions, total in stats['histogram']:
+        span = f"{low}" if low == high else f"{low}-{high}"
+        print(f"{span}: {regions} regions, {total} bottles")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Count region labels, one per line.")
+    parser.add_argument(
+        'paths', nargs='*',
+        help="input files ('-' for stdin; .gz/.bz2/.xz/.zst are decompressed on the fly). "
+             "Defaults to fixtures/regions.txt.",
+    )
+    parser.add_argument('--normalize', action='store_true', help="collapse CRLF, tabs, non-breaking and doubled spaces before counting")
+    parser.add_argument('--checkpoint', metavar='PATH', help="periodically save partial counts and input offsets here")
+    parser.add_argument('--checkpoint-every', type=float, default=5.0, metavar='SECONDS', help="checkpoint interval (default: 5); each checkpoint pickles every count, so raise it for inputs with millions of distinct labels")
+    parser.add_argument('--resume', action='store_true', help="continue from the --checkpoint file if it exists")
+    parser.add_argument('--pairs', type=int, metavar='N', help="input lines are order_id<TAB>region, grouped by order; report the N most frequent region pairs")
+    parser.add_argument('--vintages', action='store_true', help="input lines are region<TAB>vintage; report vintages per region")
+    parser.add_argument('--by-decade', action='store_true', help="with --vintages, break each region down by decade")
+    parser.add_argument('--vintage-range', metavar='FROM-TO', help="with --vintages, count bottles with vintages in this range, e.g. 2015-2020")
+    parser.add_argument('--region', action='append', help="with --vintages, only report this region (repeatable)")
+    parser.add_argument('--sample', type=int, metavar='N', help="estimate from a reservoir of N lines (per stratum) instead of counting exactly")
+    parser.add_argument('--stratify', action='store_true', help="input lines are business_id<TAB>region; sample each business separately")
+    parser.add_argument('--patience', type=int, default=5, help="stop sampling once the top-K ranking is unchanged for this many checks")
+    parser.add_argument('--seed', type=int, help="random seed for --sample")
+    parser.add_argument('--top', type=int, metavar='K', help="only list the K most frequent regions")
+    parser.add_argument('--write-snapshot', metavar='PATH', help="also save the counts as a memory-mappable snapshot")
+    parser.add_argument('--snapshot', metavar='PATH', help="report from a saved snapshot instead of counting input")
+    parser.add_argument('--write-summary', metavar='PATH', help="also save a mergeable count summary (JSON)")
+    parser.add_argument('--source', help="name recorded in the summary for this node/tenant (default: the input paths)")
+    parser.add_argument('--sketch-width', type=int, metavar='W', help="add a Count-Min sketch of width W to the summary")
+    parser.add_argument('--merge-summaries', nargs='+', metavar='PATH', help="report from merged summaries instead of counting input")
+    parser.add_argument('--collate', action='store_true', help="order tied counts accent- and case-insensitively (Cote/Côte together)")
+    parser.add_argument('--sort-workers', type=int, metavar='N', help="sort spilled runs in N worker processes (needs --memory-budget; counts that fit in the budget are sorted in memory)")
+    parser.add_argument('--memory-budget', type=float, metavar='MB', help="spill counts and sorted runs to disk above this size")
+    parser.add_argument('--stats', action='store_true', help="also report coverage, Gini, entropy and a count histogram")
+    parser.add_argument('--vectors', metavar='NPY', help="group regions by precomputed embeddings (labels in the matching .txt file)")
+    parser.add_argument('--vector-labels', metavar='PATH', help="label file for --vectors, one label per row")
+    parser.add_argument('--similarity', type=float, default=0.9, help="cosine similarity that links two regions (default: 0.9)")
+    parser.add_argument('--styles', action='store_true', help="also report counts by wine style (Red, White, Sparkling, ...)")
+    args = parser.parse_args(argv)
+    check_options(parser, args)
+    memory_budget = int(args.memory_budget * 2**20) if args.memory_budget else None
+    collator = None
+    if args.collate:
+        from collation import Collator
+        collator = Collator()
+    order = collator.report_key if collator else report_key
+    vintage_range = None
+    if args.vintage_range:
+        try:
+            low, high = (int(year) for year in args.vintage_range.split('-'))
+        except ValueError:
+            parser.error(f"--vintage-range expects FROM-TO, got {args.vintage_range!r}")
+        vintage_range = (low, high)
+    if args.checkpoint and memory_budget:
+        parser.error("--checkpoint cannot be combined with --memory-budget")
+
+    if args.snapshot:
+        from snapshot import Snapshot
+        with Snapshot(args.snapshot) as snap:
+            print_report(snap.total, len(snap), snap.top(args.top))
+        return
+
+    if args.merge_summaries:
+        from summary import CountSummary, merge_all
+        try:
+            merged = merge_all(CountSummary.load(path) for path in args.merge_summaries)
+        except ValueError as exc:
+            parser.error(str(exc))
+        if merged.counts is None:
+            parser.error("merged summaries carry only sketches; no exact counts to list")
+        region_counts = merged.counts
+        sorted_counts = sort_counts(region_counts, args.sort_workers, memory_budget, collator=collator)
+        print_report(merged.total, len(region_counts), islice(sorted_counts, args.top))
+        return
+
+    # Process the data
+    paths = args.paths or [DEFAULT_INPUT]
+    normalizer = None
+    if args.normalize:
+        from normalize import Normalizer
+        normalizer = Normalizer()
+    # Tab-delimited input is split into fields before normalizing, so the
+    # tabs rule never eats the separator
+    tabbed = args.pairs or args.vintages or (args.sample and args.stratify)
+    transform = None if tabbed else normalizer
+    # The normalizer only rewrites ASCII and no-break spaces; strip() still
+    # catches the rest of Unicode whitespace at the edges
+    lines = (line.strip() for path in paths for line in iter_lines(path, transform=transform))
+
+    if args.vintages:
+        from vintage import VintageCounter
+        vintages = VintageCounter()
+        vintages.add_lines(lines, normalizer)
+        vintages.freeze()
+        print_vintages(vintages, args.region, vintage_range, args.by_decade, args.top, order)
+        return
+
+    if args.pairs:
+        from cooccur import PairCounter
+        pair_counter = PairCounter()
+        pair_counter.add_records(split_records(lines, normalizer))
+        print(f"Groups: {pair_counter.groups}")
+        print(f"Distinct region pairs: {len(pair_counter.pairs)}\n")
+        for a, b, count in pair_counter.top(args.pairs):
+            print(f"{a} + {b}: {count}")
+        return
+
+    if args.sample:
+        from sampling import preview
+        if args.stratify:
+            records = split_records(lines, normalizer)
+        else:
+            records = (('', line) for line in lines if line)
+        estimator, stopped = preview(records, args.sample, args.top or 10, args.patience, seed=args.seed)
+        print_estimates(estimator, stopped, args.top)
+        return
+
+    # Count occurrences
+    if args.checkpoint:
+        from checkpoint import count_resumable
+        region_counts = count_resumable(paths, args.checkpoint, args.checkpoint_every, args.resume, normalizer)
+    elif memory_budget:
+        from spill import SpillingCounter, peak_memory_bytes
+        counter = SpillingCounter(memory_budget)
+        counter.update(region for region in lines if region)
+        region_counts = counter.finish()
+    else:
+        region_counts = Counter(region for region in lines if region)
+    total = sum(region_counts.values())
+    unique_count = len(region_counts)
+
+    if args.write_snapshot:
+        from snapshot import write_snapshot
+        write_snapshot(args.write_snapshot, region_counts)
+    if args.write_summary:
+        from summary import write_summary
+        source = args.source or ','.join(paths)
+        write_summary(args.write_summary, region_counts, source, args.sketch_width)
+
+    # Sort by count descending, then region name ascending
+    if memory_budget:
+        worker_baseline = peak_memory_bytes(children=True)  # may be inherited from our parent
+    sorted_counts = sort_counts(region_counts, args.sort_workers, memory_budget, collator=collator)
+
+    # Print results
+    print_report(total, unique_count, islice(sorted_counts, args.top))
+    if memory_budget:
+        peak, worker_peak = peak_memory_bytes(), peak_memory_bytes(children=True)
+        print(f"\nSpilled count runs: {len(counter.runs)}")
+        if not peak:
+            print("Peak memory: unavailable")
+        elif worker_peak != worker_baseline:
+            print(f"Peak memory: {peak / 2**20:.1f} MiB, plus up to {worker_peak / 2**20:.1f} MiB per sort worker")
+        else:
+            print(f"Peak memory: {peak / 2**20:.1f} MiB")
+
+    if args.stats:
+        from stats import distribution
+        print_distribution(distribution(region_counts))
+
+    if args.vectors:
+        from semantic import count_clusters, load_vectors
+        index, matrix = load_vectors(args.vectors, args.vector_labels)
+        print("\nCounts by semantic cluster:")
+        for leader, count, members in islice(count_clusters(region_counts, index, matrix, args.similarity), args.top):
+            others = [label for label in members if label != leader]
+            print(f"{leader}: {count}" + (f" (with {', '.join(others)})" if others else ""))
 
-# Print results
-print(f"Total quantity: {total}")
-print(f"Number of unique regions: {unique_count}\n")
+    if normalizer:
+        print("\nLines changed by normalization rule:")
+        for rule, changed in normalizer.changed.items():
+            print(f"{rule}: {changed}")
 
+    if args.styles:
+        from styles import StyleClassifier
+        style_counts = StyleClassifier().count_styles(region_counts)
+        print("\nCounts by style:")
+        for style, count in sorted(style_counts.items(), key=order):
+            print(f"{style}: {count}")
 
-# Sort by count descending, then region name ascending
-sorted_counts = sorted(region_counts.items(), key=lambda x: (-x[1], x[0]))
 
-for region, count in sorted_counts:
-    print(f"{region}: {count}")
\ No newline at end of file
+if __name__ == '__main__':
+    main()
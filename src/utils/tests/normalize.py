@@ -0,0 +1,57 @@
+"""Whitespace and line-ending normalization for dirty exports.
+
+Exports arrive with CRLF endings, trailing tabs, non-breaking spaces and
+doubled internal spaces, all of which split one region into several keys.
+``Normalizer`` cleans a block of complete lines at a time on the raw bytes.
+Each rule first probes the block with plain substring checks, so a clean
+block costs a few ``in`` scans and no regex work. A dirty block gets a
+single substitution pass per rule, and the rule counts the lines it changed
+from that same pass: directly from ``subn`` when the pattern can only match
+once per line, otherwise by noting the line of each match.
+"""
+
+import re
+from collections import Counter
+
+# Rules run in this order; each is (name, probe, pattern, replacement,
+# whether the pattern matches at most once per line)
+RULES = (
+    ('crlf', lambda block: b'\r' in block, re.compile(rb'\r\n'), b'\n', True),
+    # U+00A0, U+202F, U+2007
+    ('nbsp', lambda block: b'\xc2\xa0' in block or b'\xe2\x80' in block,
+     re.compile(rb'\xc2\xa0|\xe2\x80\xaf|\xe2\x80\x87'), b' ', False),
+    ('tabs', lambda block: b'\t' in block or b'\v' in block or b'\f' in block,
+     re.compile(rb'[\t\v\f]'), b' ', False),
+    ('strip', lambda block: b' \n' in block or b'\n ' in block or block.startswith(b' '),
+     re.compile(rb'^ +| +$', re.M), b'', False),
+    ('collapse', lambda block: b'  ' in block, re.compile(rb'  +'), b' ', False),
+)
+
+
+class Normalizer:
+    """Callable that cleans a bytes block of ``\\n``-terminated lines."""
+
+    def __init__(self):
+        self.changed = Counter({name: 0 for name, *_ in RULES})
+
+    def __call__(self, block):
+        for name, probe, pattern, replacement, once_per_line in RULES:
+            if not probe(block):
+                continue
+            if once_per_line:
+                block, hits = pattern.subn(replacement, block)
+                self.changed[name] += hits
+                continue
+            lines = set()
+
+            def rewrite(match, block=block):
+                lines.add(block.rfind(b'\n', 0, match.start()))
+                return replacement
+
+            block = pattern.sub(rewrite, block)
+            self.changed[name] += len(lines)
+        return block
+
+    def clean(self, field):
+        """Normalize one already-split text field, counting it as a line."""
+        return self(field.encode() + b'\n')[:-1].decode()
@@ -0,0 +1,121 @@
+"""Sampled previews of the region distribution.
+
+``SampleEstimator`` keeps a uniform reservoir of lines (one reservoir per
+stratum when stratifying by business_id) and estimates each region's count
+with a normal-approximation confidence interval, including the finite
+population correction. ``preview`` feeds it a line stream and stops reading
+once the top-K ranking has stayed the same for ``patience`` consecutive
+checks, so a large export gives a usable answer after a fraction of a scan.
+Each stratum keeps a running count of the regions in its reservoir, and the
+checks are spaced by the lines read (``size`` per stratum), so a check costs
+one pass over the distinct regions per stratum and stays rare as strata grow.
+
+Estimates describe the lines actually read. When the preview stops early,
+that is a prefix of the input, so an export sorted by region or business
+skews it. Stratifying by business_id guards against the latter. Shares of
+the lines read are the figures that carry over to the whole export; counts
+are only reported as counts within the prefix.
+"""
+
+import heapq
+import math
+import random
+from collections import Counter
+
+Z_95 = 1.959964
+
+
+class SampleEstimator:
+    """Per-stratum reservoirs plus stratified count estimates."""
+
+    def __init__(self, size, seed=None):
+        self.size = size
+        self._rng = random.Random(seed)
+        self._reservoirs = {}
+        self._hits = {}
+        self._seen = Counter()
+        self.seen = 0
+
+    @property
+    def strata(self):
+        return len(self._reservoirs)
+
+    def add(self, region, stratum=''):
+        """Offer one line to its stratum's reservoir (Algorithm R)."""
+        reservoir = self._reservoirs.get(stratum)
+        if reservoir is None:
+            reservoir = self._reservoirs[stratum] = []
+            self._hits[stratum] = Counter()
+        hits = self._hits[stratum]
+        self.seen += 1
+        self._seen[stratum] += 1
+        if len(reservoir) < self.size:
+            reservoir.append(region)
+            hits[region] += 1
+        else:
+            j = self._rng.randrange(self._seen[stratum])
+            if j < self.size and reservoir[j] != region:
+                evicted = reservoir[j]
+                hits[evicted] -= 1
+                if not hits[evicted]:
+                    del hits[evicted]
+                hits[region] += 1
+                reservoir[j] = region
+
+    def estimates(self, z=Z_95, finite=True):
+        """Return ``(region, estimate, low, high)`` rows, largest first.
+
+        With ``finite=False`` the finite population correction is dropped, so
+        the interval treats the lines read as a sample of a larger input.
+        """
+        totals = Counter()
+        variances = Counter()
+        for stratum, reservoir in self._reservoirs.items():
+            n, population = len(reservoir), self._seen[stratum]
+            fpc = (population - n) / (population - 1) if population > 1 else 0.0
+            if not finite:
+                fpc = 1.0
+            for region, hits in self._hits[stratum].items():
+                p = hits / n
+                totals[region] += population * p
+                variances[region] += population ** 2 * p * (1 - p) / n * fpc
+        # A region absent from a stratum's sample adds no variance for that
+        # stratum, so intervals for rare regions are optimistic.
+        rows = []
+        for region, estimate in totals.items():
+            margin = z * math.sqrt(variances[region])
+            rows.append((region, estimate, max(0.0, estimate - margin), estimate + margin))
+        rows.sort(key=lambda row: (-row[1], row[0]))
+        return rows
+
+    def top(self, k):
+        """Return the ``k`` regions with the largest estimates."""
+        totals = Counter()
+        for stratum, hits in self._hits.items():
+            n, population = len(self._reservoirs[stratum]), self._seen[stratum]
+            for region, count in hits.items():
+                totals[region] += population * (count / n)
+        best = heapq.nsmallest(k, totals.items(), key=lambda item: (-item[1], item[0]))
+        return tuple(region for region, _ in best)
+
+
+def preview(records, size, k=10, patience=5, check_every=None, seed=None):
+    """Sample ``(stratum, region)`` records until the top-``k`` stabilizes.
+
+    The ranking is checked every ``check_every`` lines, by default ``size``
+    lines per stratum seen so far. Returns ``(estimator, stopped_early)``.
+    """
+    estimator = SampleEstimator(size, seed)
+    next_check = check_every or size
+    ranking, stable = None, 0
+    for seen, (stratum, region) in enumerate(records, 1):
+        estimator.add(region, stratum)
+        if seen < next_check:
+            continue
+        next_check = seen + (check_every or size * estimator.strata)
+        current = estimator.top(k)
+        stable = stable + 1 if current == ranking else 0
+        ranking = current
+        if stable >= patience:
+            return estimator, True
+    return estimator, False
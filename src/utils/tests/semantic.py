@@ -0,0 +1,88 @@
+"""Group distinct region labels by embedding similarity.
+
+Vectors are precomputed (the same wine_inventory text embeddings that
+sync-wine-vectors.ts pushes to Pinecone) and stored locally as an ``.npy``
+matrix with a sidecar text file holding one label per row. The matrix is
+memory-mapped and only the rows for labels actually present are read, so no
+embedding API is called and the cost depends on the number of distinct
+labels, not on the input length.
+
+Labels whose cosine similarity reaches the threshold are linked, and the
+connected components (single linkage) become the clusters. Labels without a
+vector stay in clusters of their own.
+"""
+
+import os
+
+BATCH_ROWS = 1024  # rows of the similarity matrix computed at a time
+
+
+def _numpy():
+    try:
+        import numpy
+    except ImportError:
+        raise RuntimeError("semantic grouping needs NumPy installed") from None
+    return numpy
+
+
+def labels_path(vectors_path):
+    """Default sidecar label file for ``vectors_path`` (``x.npy`` -> ``x.txt``)."""
+    return os.path.splitext(vectors_path)[0] + '.txt'
+
+
+def load_vectors(vectors_path, labels_file=None):
+    """Return ``(label -> row index, memory-mapped matrix)``."""
+    np = _numpy()
+    matrix = np.load(vectors_path, mmap_mode='r')
+    with open(labels_file or labels_path(vectors_path), encoding='utf-8') as f:
+        labels = [line.rstrip('\n') for line in f]
+    if len(labels) != matrix.shape[0]:
+        raise ValueError(f"{vectors_path}: {matrix.shape[0]} vectors but {len(labels)} labels")
+    return {label: row for row, label in enumerate(labels)}, matrix
+
+
+def _find(parent, i):
+    while parent[i] != i:
+        parent[i] = parent[parent[i]]
+        i = parent[i]
+    return i
+
+
+def cluster_labels(labels, index, matrix, threshold=0.9, batch_rows=BATCH_ROWS):
+    """Partition ``labels`` into lists of semantically similar labels."""
+    np = _numpy()
+    embedded = [label for label in labels if label in index]
+    parent = list(range(len(embedded)))
+    if embedded:
+        vectors = np.asarray(matrix[[index[label] for label in embedded]], dtype=np.float32)
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        vectors /= np.where(norms == 0, 1, norms)
+        for start in range(0, len(embedded), batch_rows):
+            sims = vectors[start:start + batch_rows] @ vectors.T
+            rows, cols = np.nonzero(sims >= threshold)
+            for i, j in zip((rows + start).tolist(), cols.tolist()):
+                if i < j:
+                    a, b = _find(parent, i), _find(parent, j)
+                    if a != b:
+                        parent[max(a, b)] = min(a, b)
+
+    groups = {}
+    for i, label in enumerate(embedded):
+        groups.setdefault(_find(parent, i), []).append(label)
+    clusters = list(groups.values())
+    clusters.extend([label] for label in labels if label not in index)
+    return clusters
+
+
+def count_clusters(counts, index, matrix, threshold=0.9):
+    """Return ``(leader, total, members)`` per cluster, largest first.
+
+    The leader is the member with the highest count.
+    """
+    counts = dict(counts.items())  # one pass; spilled counts have no cheap lookup
+    rows = []
+    for members in cluster_labels(list(counts), index, matrix, threshold):
+        members.sort(key=lambda label: (-counts[label], label))
+        rows.append((members[0], sum(counts[label] for label in members), members))
+    rows.sort(key=lambda row: (-row[1], row[0]))
+    return rows
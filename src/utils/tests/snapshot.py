@@ -0,0 +1,146 @@
+"""Columnar on-disk count snapshots with memory-mapped random access.
+
+A snapshot stores the distinct keys sorted by their UTF-8 bytes as an
+offsets column plus one blob, the counts as a fixed-width integer column, and
+a rank column giving the report order (count descending, key ascending).
+Readers ``mmap`` the file, so looking up one region is a binary search over
+the offsets and a top-K slice reads K rows; nothing else is paged in.
+Writing streams the keys once in sorted order, so spilled counts are never
+loaded into memory.
+
+Layout (all integers little-endian)::
+
+    magic    8 bytes   b'RCSNAP1\\0'
+    header   3 x u64   key count n, blob length, total count
+    offsets  (n+1) x u64   key i is blob[offsets[i]:offsets[i+1]]
+    counts   n x u64
+    rank     n x u32   key index of the i-th row in report order
+    blob     UTF-8 key bytes
+"""
+
+import mmap
+import os
+import shutil
+import struct
+import tempfile
+from array import array
+from collections import defaultdict
+
+from spill import key_sorted_items
+
+MAGIC = b'RCSNAP1\0'
+_HEADER = struct.Struct('<8sQQQ')
+_U64 = struct.Struct('<Q')
+_U32 = struct.Struct('<I')
+
+
+def _little_endian(values):
+    if array('H', [1]).tobytes() != b'\x01\x00':
+        values.byteswap()
+    return values.tobytes()
+
+
+def write_snapshot(path, counts):
+    """Write the ``counts`` mapping to ``path`` atomically.
+
+    The offsets, counts and blob sections are streamed to side files in one
+    pass over the key-sorted items. Only a u32 key index per key stays in
+    memory, bucketed by count: key order within a bucket is already the
+    tie order, so the rank column is the buckets from the highest count down.
+    """
+    by_count = defaultdict(lambda: array('I'))
+    n = blob_len = total = 0
+    side_dir = os.path.dirname(os.path.abspath(path))
+    with tempfile.TemporaryFile(dir=side_dir) as offsets, \
+            tempfile.TemporaryFile(dir=side_dir) as column, \
+            tempfile.TemporaryFile(dir=side_dir) as blob:
+        offsets.write(_U64.pack(0))
+        for key, count in key_sorted_items(counts):
+            key = key.encode('utf-8')
+            blob.write(key)
+            blob_len += len(key)
+            offsets.write(_U64.pack(blob_len))
+            column.write(_U64.pack(count))
+            by_count[count].append(n)
+            n += 1
+            total += count
+
+        tmp = f"{path}.tmp"
+        with open(tmp, 'wb') as out:
+            out.write(_HEADER.pack(MAGIC, n, blob_len, total))
+            for section in (offsets, column):
+                section.seek(0)
+                shutil.copyfileobj(section, out)
+            for count in sorted(by_count, reverse=True):
+                out.write(_little_endian(by_count[count]))
+            blob.seek(0)
+            shutil.copyfileobj(blob, out)
+    os.replace(tmp, path)
+
+
+class Snapshot:
+    """Read-only, memory-mapped view of a snapshot file."""
+
+    def __init__(self, path):
+        with open(path, 'rb') as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self._n, blob_len, self.total = _HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC:
+            self._mm.close()
+            raise ValueError(f"{path}: not a count snapshot")
+        self._offsets = _HEADER.size
+        self._counts = self._offsets + 8 * (self._n + 1)
+        self._rank = self._counts + 8 * self._n
+        self._blob = self._rank + 4 * self._n
+        if self._blob + blob_len != len(self._mm):
+            self._mm.close()
+            raise ValueError(f"{path}: truncated snapshot")
+
+    def close(self):
+        self._mm.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self):
+        return self._n
+
+    def _key_bytes(self, i):
+        start, = _U64.unpack_from(self._mm, self._offsets + 8 * i)
+        end, = _U64.unpack_from(self._mm, self._offsets + 8 * (i + 1))
+        return self._mm[self._blob + start:self._blob + end]
+
+    def _count(self, i):
+        return _U64.unpack_from(self._mm, self._counts + 8 * i)[0]
+
+    def _find(self, key):
+        target = key.encode('utf-8')
+        lo, hi = 0, self._n
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._key_bytes(mid) < target:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < self._n and self._key_bytes(lo) == target:
+            return lo
+        return -1
+
+    def get(self, key, default=0):
+        i = self._find(key)
+        return default if i < 0 else self._count(i)
+
+    def __contains__(self, key):
+        return self._find(key) >= 0
+
+    def top(self, k=None, start=0):
+        """Return ``(key, count)`` rows ``start:start+k`` in report order."""
+        stop = self._n if k is None else min(self._n, start + k)
+        rows = []
+        for row in range(start, stop):
+            i, = _U32.unpack_from(self._mm, self._rank + 4 * row)
+            rows.append((self._key_bytes(i).decode('utf-8'), self._count(i)))
+        return rows
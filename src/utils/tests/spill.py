@@ -0,0 +1,122 @@
+"""Counting under a memory budget with spill-to-disk.
+
+``SpillingCounter`` tracks an estimate of its own footprint as new keys
+arrive. Once the estimate passes the budget it writes its counts to disk as
+a key-sorted run and starts over. ``finish`` returns the in-memory
+``Counter`` when nothing was spilled. Otherwise it merges the runs, summing
+counts per key, into a single key-sorted run, at most ``extsort.FAN_IN``
+runs at a time, and returns a ``SpilledCounts`` view that streams it, so
+results stay exact without ever holding every key in memory.
+"""
+
+import heapq
+import os
+import sys
+import tempfile
+from collections import Counter
+from collections.abc import Mapping
+from itertools import groupby
+from operator import itemgetter
+
+from extsort import FAN_IN, ITEM_OVERHEAD, read_run, reduce_runs, write_run
+
+
+def peak_memory_bytes(children=False):
+    """Peak resident set size of this process, or None where unavailable.
+
+    With ``children=True``, the peak of the largest finished child process
+    instead, such as a sort worker.
+    """
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    who = resource.RUSAGE_CHILDREN if children else resource.RUSAGE_SELF
+    peak = resource.getrusage(who).ru_maxrss
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+def sum_runs(paths):
+    """Merge key-sorted runs, summing the counts of keys found in several."""
+    runs = [read_run(path) for path in paths]
+    for key, group in groupby(heapq.merge(*runs), key=itemgetter(0)):
+        yield key, sum(count for _, count in group)
+
+
+class SpilledCounts(Mapping):
+    """Read-only mapping over a key-sorted run of distinct keys on disk."""
+
+    def __init__(self, path, length, spill_dir=None):
+        self._path = path
+        self._len = length
+        self._spill_dir = spill_dir  # keeps the run's temporary directory alive
+
+    def items(self):
+        return read_run(self._path)
+
+    def values(self):
+        return (count for _, count in self.items())
+
+    def __iter__(self):
+        return (key for key, _ in self.items())
+
+    def __len__(self):
+        return self._len
+
+    def __getitem__(self, key):
+        # Linear scan; callers needing random access should load a Counter
+        for candidate, count in self.items():
+            if candidate == key:
+                return count
+        raise KeyError(key)
+
+
+class SpillingCounter:
+    """Counter that spills key-sorted runs to disk past a memory budget."""
+
+    def __init__(self, memory_budget, tmpdir=None, fan_in=FAN_IN):
+        self.memory_budget = memory_budget
+        self.fan_in = fan_in
+        self.counts = Counter()
+        self.runs = []
+        self._bytes = 0
+        self._dir = tempfile.TemporaryDirectory(prefix='count-runs-', dir=tmpdir)
+
+    def update(self, keys):
+        counts = self.counts
+        for key in keys:
+            if key in counts:
+                counts[key] += 1
+                continue
+            counts[key] = 1
+            self._bytes += sys.getsizeof(key) + ITEM_OVERHEAD
+            if self._bytes > self.memory_budget:
+                self.spill()
+                counts = self.counts
+
+    def spill(self):
+        path = os.path.join(self._dir.name, f"run-{len(self.runs):05d}.tsv")
+        write_run(path, sorted(self.counts.items()))
+        self.runs.append(path)
+        self.counts = Counter()
+        self._bytes = 0
+
+    def finish(self):
+        """Return the final counts (a ``Counter`` or a ``SpilledCounts``)."""
+        if not self.runs:
+            return self.counts
+        if self.counts:
+            self.spill()
+        runs = reduce_runs(self.runs, sum_runs, self._dir.name, self.fan_in)
+        path = os.path.join(self._dir.name, 'counts.tsv')
+        length = write_run(path, sum_runs(runs))
+        for run in runs:
+            os.remove(run)
+        return SpilledCounts(path, length, self._dir)
+
+
+def key_sorted_items(counts):
+    """Yield the items of ``counts`` in key order, streamed straight off the runs when spilled."""
+    if isinstance(counts, SpilledCounts):
+        return counts.items()
+    return iter(sorted(counts.items()))
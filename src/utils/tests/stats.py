@@ -0,0 +1,65 @@
+"""Distribution statistics over a ``label -> count`` mapping.
+
+Everything here is derived from the frequency-of-counts table (how many
+regions have each count), built in one pass over the counts. That table has
+at most about sqrt(2 * total) rows, so coverage, Gini, entropy and the
+log-bucket histogram never re-sort the regions themselves.
+"""
+
+import math
+from collections import Counter
+
+COVERAGE_LEVELS = (0.5, 0.8, 0.95)
+
+
+def distribution(counts, coverage_levels=COVERAGE_LEVELS):
+    """Summarize how concentrated ``counts`` is.
+
+    Returns a dict with ``total``, ``regions``, ``coverage`` (level -> number
+    of regions, largest first, needed to reach that share of the total),
+    ``gini``, ``entropy`` (bits), ``normalized_entropy`` and ``histogram``
+    (list of ``(low, high, regions, total)`` for counts in ``[low, high]``,
+    in power-of-two buckets).
+    """
+    freq = Counter(counts.values())
+    freq.pop(0, None)
+    regions = sum(freq.values())
+    total = sum(count * m for count, m in freq.items())
+    if not total:
+        return {'total': 0, 'regions': 0, 'coverage': {level: 0 for level in coverage_levels},
+                'gini': 0.0, 'entropy': 0.0, 'normalized_entropy': 0.0, 'histogram': []}
+    descending = sorted(freq.items(), reverse=True)
+
+    # Coverage: take regions largest first until each level is reached
+    coverage = {}
+    covered = taken = 0
+    pending = sorted(coverage_levels)
+    for count, m in descending:
+        while pending and covered + count * m >= pending[0] * total:
+            need = math.ceil((pending[0] * total - covered) / count)
+            coverage[pending.pop(0)] = taken + max(need, 0)
+        covered += count * m
+        taken += m
+
+    # Gini over ascending ranks; m equal counts occupy ranks r+1..r+m
+    weighted = rank = 0
+    for count, m in reversed(descending):
+        weighted += count * m * (2 * rank + m + 1) / 2
+        rank += m
+    gini = 2 * weighted / (regions * total) - (regions + 1) / regions
+
+    entropy = sum(m * (count / total) * -math.log2(count / total) for count, m in freq.items())
+    normalized = entropy / math.log2(regions) if regions > 1 else 0.0
+
+    buckets = Counter()
+    for count, m in freq.items():
+        bucket = count.bit_length() - 1
+        buckets[bucket, 'regions'] += m
+        buckets[bucket, 'total'] += count * m
+    histogram = [
+        (1 << b, (2 << b) - 1, buckets[b, 'regions'], buckets[b, 'total'])
+        for b in sorted({b for b, _ in buckets})
+    ]
+
+    return {'total': total, 'regions': regions, 'coverage': coverage, 'gini': gini,
+            'entropy': entropy, 'normalized_entropy': normalized, 'histogram': histogram}
@@ -0,0 +1,187 @@
+"""Style/colour classification of region labels.
+
+Labels carry their style in inconsistent places ("Burgundy Côte de Nuits Red",
+"Spanish Manzanilla Sherry Fortified", "White Port") or only implicitly
+("Jura Vin Jaune", "Macvin", "Napa Valley Cabernet Sauvignon"). Every token in
+``STYLE_TOKENS`` is compiled once into an Aho-Corasick automaton, so a label
+is classified in a single left-to-right scan, and results are memoized per
+distinct label. The automaton for the built-in dictionary is compiled lazily,
+on first use, and shared by every classifier in the process.
+
+When several tokens match, the lowest tier wins (a fortified/sparkling/dessert
+marker beats a colour word, which beats a grape or appellation); within a
+tier the rightmost match wins.
+"""
+
+import unicodedata
+from collections import Counter, deque
+from functools import cache
+
+UNKNOWN = 'Unknown'
+
+# token -> (style, tier)
+STYLE_TOKENS = {
+    # tier 0: style markers that override any colour
+    'fortified': ('Fortified', 0),
+    'port': ('Fortified', 0),
+    'sherry': ('Fortified', 0),
+    'madeira': ('Fortified', 0),
+    'macvin': ('Fortified', 0),
+    'sparkling': ('Sparkling', 0),
+    'champagne': ('Sparkling', 0),
+    'cava': ('Sparkling', 0),
+    'prosecco': ('Sparkling', 0),
+    'franciacorta': ('Sparkling', 0),
+    'crémant': ('Sparkling', 0),
+    'dessert': ('Dessert', 0),
+    'sauternes': ('Dessert', 0),
+    'tokaji': ('Dessert', 0),
+    # tier 1: explicit colour words
+    'red': ('Red', 1),
+    'white': ('White', 1),
+    'rosé': ('Rosé', 1),
+    'rose': ('Rosé', 1),
+    # tier 2: grapes and appellations that imply a colour
+    'amarone': ('Red', 2),
+    'barbaresco': ('Red', 2),
+    'barbera': ('Red', 2),
+    'barolo': ('Red', 2),
+    'blaufränkisch': ('Red', 2),
+    'bolgheri': ('Red', 2),
+    'bordeaux blend': ('Red', 2),
+    'brunello': ('Red', 2),
+    'cabernet': ('Red', 2),
+    'chianti': ('Red', 2),
+    'cinsault': ('Red', 2),
+    'cornas': ('Red', 2),
+    'côte-rotie': ('Red', 2),
+    'crozes-hermitage': ('Red', 2),
+    'grenache': ('Red', 2),
+    'haut-médoc': ('Red', 2),
+    'hermitage': ('Red', 2),
+    'libournais': ('Red', 2),
+    'malbec': ('Red', 2),
+    'margaux': ('Red', 2),
+    'mencia': ('Red', 2),
+    'merlot': ('Red', 2),
+    'montepulciano': ('Red', 2),
+    'nebbiolo': ('Red', 2),
+    'pauillac': ('Red', 2),
+    'pessac-léognan': ('Red', 2),
+    'pinot noir': ('Red', 2),
+    'pomerol': ('Red', 2),
+    'priorat': ('Red', 2),
+    'ribera del duero': ('Red', 2),
+    'saint-émilion': ('Red', 2),
+    'saint-estèphe': ('Red', 2),
+    'saint-joseph': ('Red', 2),
+    'saint-julien': ('Red', 2),
+    'shiraz': ('Red', 2),
+    'spätburgunder': ('Red', 2),
+    'syrah': ('Red', 2),
+    'valpolicella': ('Red', 2),
+    'zinfandel': ('Red', 2),
+    'albariño': ('White', 2),
+    'chablis': ('White', 2),
+    'chardonnay': ('White', 2),
+    'chenin blanc': ('White', 2),
+    'condrieu': ('White', 2),
+    'gewürztraminer': ('White', 2),
+    'grüner veltliner': ('White', 2),
+    'muscadet': ('White', 2),
+    'pinot blanc': ('White', 2),
+    'pinot grigio': ('White', 2),
+    'pinot gris': ('White', 2),
+    'riesling': ('White', 2),
+    'sauvignon blanc': ('White', 2),
+    'sémillon': ('White', 2),
+    'vin jaune': ('White', 2),
+    'vinho verde': ('White', 2),
+    'viognier': ('White', 2),
+}
+
+
+class Automaton:
+    """Aho-Corasick automaton mapping pattern strings to payloads."""
+
+    def __init__(self, patterns):
+        self._goto = [{}]
+        self._fail = [0]
+        self._out = [[]]
+        for pattern, payload in patterns.items():
+            node = 0
+            for ch in pattern:
+                nxt = self._goto[node].get(ch)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[node][ch] = nxt
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append([])
+                node = nxt
+            self._out[node].append((len(pattern), payload))
+
+        # Breadth-first pass to fill in failure links and merge outputs;
+        # depth-1 nodes keep the root as their failure link
+        pending = deque(self._goto[0].values())
+        while pending:
+            node = pending.popleft()
+            for ch, nxt in self._goto[node].items():
+                pending.append(nxt)
+                fail = self._fail[node]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[nxt] = self._goto[fail].get(ch, 0)
+                self._out[nxt].extend(self._out[self._fail[nxt]])
+
+    def iter_matches(self, text):
+        """Yield ``(start, end, payload)`` for every pattern occurrence."""
+        goto, fail, out = self._goto, self._fail, self._out
+        node = 0
+        for i, ch in enumerate(text):
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            for length, payload in out[node]:
+                yield i + 1 - length, i + 1, payload
+
+
+@cache
+def default_automaton():
+    return Automaton(STYLE_TOKENS)
+
+
+def _is_boundary(text, i):
+    return i < 0 or i >= len(text) or not text[i].isalnum()
+
+
+class StyleClassifier:
+    """Tag labels with a style using a precompiled token automaton."""
+
+    def __init__(self, tokens=None):
+        self._automaton = default_automaton() if tokens is None else Automaton(tokens)
+        self._cache = {}
+
+    def classify(self, label):
+        style = self._cache.get(label)
+        if style is None:
+            style = self._cache[label] = self._classify(label)
+        return style
+
+    def _classify(self, label):
+        # Tokens are stored composed; decomposed labels must match them too
+        text = unicodedata.normalize('NFC', label).casefold()
+        best = None
+        for start, end, (style, tier) in self._automaton.iter_matches(text):
+            if not (_is_boundary(text, start - 1) and _is_boundary(text, end)):
+                continue
+            if best is None or (tier, -end) <= (best[0], -best[1]):
+                best = (tier, end, style)
+        return UNKNOWN if best is None else best[2]
+
+    def count_styles(self, counts):
+        """Fold a ``label -> count`` mapping into ``style -> count``."""
+        style_counts = Counter()
+        for label, count in counts.items():
+            style_counts[self.classify(label)] += count
+        return style_counts
@@ -0,0 +1,158 @@
+"""Mergeable count summaries for distributed aggregation.
+
+Each node counts its own business's region lists and ships a
+``CountSummary`` instead of raw lines. Merging is associative and
+commutative, so summaries can be combined in any order or as a tree
+(``merge_all``) to get the global distribution.
+
+A summary holds exact counts and, optionally, a Count-Min sketch. The sketch
+stays small however many distinct keys there are; a node can drop its exact
+counts (``exact=False``) and ship only the sketch, in which case every
+summary it is merged into is sketch-only too. ``write_summary`` writes a
+node's summary straight from its counts in one streaming pass, so counts
+spilled under a memory budget are never loaded.
+"""
+
+import hashlib
+import json
+from collections import Counter
+
+from spill import key_sorted_items
+
+FORMAT = 'region-count-summary/1'
+
+
+class CountMinSketch:
+    """Count-Min sketch with stable (process-independent) hashing."""
+
+    def __init__(self, width, depth=4, table=None):
+        self.width = width
+        self.depth = depth
+        self.table = table or [[0] * width for _ in range(depth)]
+
+    def _columns(self, key):
+        digest = hashlib.blake2b(key.encode('utf-8'), digest_size=8 * self.depth).digest()
+        for row in range(self.depth):
+            yield int.from_bytes(digest[8 * row:8 * row + 8], 'little') % self.width
+
+    def add(self, key, count=1):
+        for row, col in enumerate(self._columns(key)):
+            self.table[row][col] += count
+
+    def estimate(self, key):
+        return min(self.table[row][col] for row, col in enumerate(self._columns(key)))
+
+    def merge(self, other):
+        if (self.width, self.depth) != (other.width, other.depth):
+            raise ValueError("cannot merge sketches of different shapes")
+        return CountMinSketch(self.width, self.depth, [
+            [a + b for a, b in zip(mine, theirs)]
+            for mine, theirs in zip(self.table, other.table)
+        ])
+
+
+class CountSummary:
+    """Serializable, mergeable summary of one or more count runs."""
+
+    def __init__(self, counts=None, sketch=None, sources=(), total=None):
+        self.counts = counts
+        self.sketch = sketch
+        self.sources = tuple(sorted(sources))
+        self.total = sum(counts.values()) if total is None else total
+
+    @classmethod
+    def from_counts(cls, counts, source, sketch_width=None, sketch_depth=4, exact=True):
+        if not sketch_width and not exact:
+            raise ValueError("a summary without exact counts needs a sketch")
+        sketch = CountMinSketch(sketch_width, sketch_depth) if sketch_width else None
+        exact_counts = Counter() if exact else None
+        total = 0
+        for key, count in counts.items():
+            total += count
+            if sketch is not None:
+                sketch.add(key, count)
+            if exact_counts is not None:
+                exact_counts[key] = count
+        return cls(exact_counts, sketch, (source,), total)
+
+    def estimate(self, key):
+        """Exact count when available, otherwise the sketch estimate."""
+        if self.counts is not None:
+            return self.counts.get(key, 0)
+        return self.sketch.estimate(key)
+
+    def merge(self, other):
+        overlap = set(self.sources) & set(other.sources)
+        if overlap:
+            raise ValueError(f"summaries overlap on sources {sorted(overlap)}; merging would double count")
+        counts = None
+        if self.counts is not None and other.counts is not None:
+            counts = self.counts + other.counts
+        sketch = None
+        if self.sketch is not None and other.sketch is not None:
+            sketch = self.sketch.merge(other.sketch)
+        if counts is None and sketch is None:
+            raise ValueError("summaries share neither exact counts nor a sketch shape")
+        return CountSummary(counts, sketch, self.sources + other.sources, self.total + other.total)
+
+    def to_dict(self):
+        data = {'format': FORMAT, 'sources': list(self.sources), 'total': self.total}
+        if self.counts is not None:
+            data['counts'] = dict(sorted(self.counts.items()))
+        if self.sketch is not None:
+            data['sketch'] = {'width': self.sketch.width, 'depth': self.sketch.depth, 'table': self.sketch.table}
+        return data
+
+    @classmethod
+    def from_dict(cls, data):
+        if data.get('format') != FORMAT:
+            raise ValueError(f"unsupported summary format {data.get('format')!r}")
+        counts = Counter(data['counts']) if 'counts' in data else None
+        sketch = None
+        if 'sketch' in data:
+            sketch = CountMinSketch(data['sketch']['width'], data['sketch']['depth'], data['sketch']['table'])
+        return cls(counts, sketch, data['sources'], data['total'])
+
+    def dump(self, path):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False, separators=(',', ':'))
+
+    @classmethod
+    def load(cls, path):
+        with open(path, encoding='utf-8') as f:
+            return cls.from_dict(json.load(f))
+
+
+def write_summary(path, counts, source, sketch_width=None, sketch_depth=4):
+    """Write the exact summary of ``counts`` to ``path`` in one streaming pass.
+
+    Equivalent to ``CountSummary.from_counts(...).dump(path)`` without
+    holding the counts in memory.
+    """
+    sketch = CountMinSketch(sketch_width, sketch_depth) if sketch_width else None
+    total = 0
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(f'{{"format":{json.dumps(FORMAT)},"sources":{json.dumps([source], ensure_ascii=False)},"counts":{{')
+        for i, (key, count) in enumerate(key_sorted_items(counts)):
+            f.write(f'{"," if i else ""}{json.dumps(key, ensure_ascii=False)}:{count}')
+            total += count
+            if sketch is not None:
+                sketch.add(key, count)
+        f.write(f'}},"total":{total}')
+        if sketch is not None:
+            table = json.dumps(sketch.table, separators=(',', ':'))
+            f.write(f',"sketch":{{"width":{sketch.width},"depth":{sketch.depth},"table":{table}}}')
+        f.write('}')
+
+
+def merge_all(summaries):
+    """Merge summaries pairwise as a balanced tree."""
+    level = list(summaries)
+    if not level:
+        raise ValueError("nothing to merge")
+    while len(level) > 1:
+        merged = [a.merge(b) for a, b in zip(level[::2], level[1::2])]
+        if len(level) % 2:
+            merged.append(level[-1])
+        level = merged
+    return level[0]
@@ -0,0 +1,86 @@
+import functools
+import gzip
+import os
+from collections import Counter
+
+import pytest
+
+import checkpoint
+import decompress
+from checkpoint import count_resumable, load_checkpoint
+
+LINES = ['Rioja', 'Barolo', 'Mosel Riesling', 'Rioja', 'Burgundy Côte de Nuits Red'] * 40
+
+
+class Interrupting:
+    """Pass-through transform that stops the run after ``blocks`` blocks."""
+
+    def __init__(self, blocks):
+        self.blocks = blocks
+        self.changed = Counter()
+
+    def __call__(self, block):
+        if not self.blocks:
+            raise KeyboardInterrupt
+        self.blocks -= 1
+        return block
+
+
+@pytest.fixture(autouse=True)
+def small_chunks(monkeypatch):
+    monkeypatch.setattr(checkpoint, 'iter_chunks', functools.partial(decompress.iter_chunks, chunk_size=64))
+
+
+def write_input(path):
+    data = ''.join(f"{line}\n" for line in LINES).encode()
+    opener = gzip.open if path.suffix == '.gz' else open
+    with opener(path, 'wb') as f:
+        f.write(data)
+    return str(path)
+
+
+def interrupt(path, checkpoint_path, blocks=5):
+    with pytest.raises(KeyboardInterrupt):
+        count_resumable([path], checkpoint_path, interval=0, normalizer=Interrupting(blocks))
+
+
+@pytest.mark.parametrize('name', ['regions.txt', 'regions.txt.gz'])
+def test_resume_after_interruption_counts_every_line_once(tmp_path, name):
+    path = write_input(tmp_path / name)
+    checkpoint_path = str(tmp_path / 'counts.ckpt')
+    interrupt(path, checkpoint_path)
+    state = load_checkpoint(checkpoint_path, [path])
+    assert 0 < state['offset'] < len(''.join(f"{line}\n" for line in LINES).encode())
+    assert 0 < sum(state['counts'].values()) < len(LINES)
+
+    assert count_resumable([path], checkpoint_path, interval=0, resume=True) == Counter(LINES)
+    assert not os.path.exists(checkpoint_path)
+
+
+def test_resume_rejects_a_modified_input(tmp_path):
+    path = write_input(tmp_path / 'regions.txt')
+    checkpoint_path = str(tmp_path / 'counts.ckpt')
+    interrupt(path, checkpoint_path)
+    with open(path, 'ab') as f:
+        f.write(b'Barolo\n')
+    with pytest.raises(ValueError, match='has changed'):
+        count_resumable([path], checkpoint_path, resume=True)
+
+
+def test_resume_rejects_a_rewritten_input_of_the_same_size(tmp_path):
+    path = write_input(tmp_path / 'regions.txt')
+    checkpoint_path = str(tmp_path / 'counts.ckpt')
+    interrupt(path, checkpoint_path)
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    with pytest.raises(ValueError, match='has changed'):
+        count_resumable([path], checkpoint_path, resume=True)
+
+
+def test_resume_rejects_other_inputs(tmp_path):
+    path = write_input(tmp_path / 'regions.txt')
+    other = write_input(tmp_path / 'other.txt')
+    checkpoint_path = str(tmp_path / 'counts.ckpt')
+    interrupt(path, checkpoint_path)
+    with pytest.raises(ValueError, match='taken for inputs'):
+        count_resumable([other], checkpoint_path, resume=True)
@@ -0,0 +1,22 @@
+import unicodedata
+
+from collation import Collator
+
+
+def test_accents_and_case_sort_together():
+    labels = ['Zinfandel', 'Côte-Rotie', 'cote chalonnaise', 'Cote-Rotie', 'Œil de Perdrix']
+    assert sorted(labels, key=Collator().sort_key) == [
+        'cote chalonnaise', 'Cote-Rotie', 'Côte-Rotie', 'Œil de Perdrix', 'Zinfandel',
+    ]
+
+
+def test_composed_and_decomposed_forms_stay_distinct_but_adjacent():
+    collator = Collator()
+    composed, decomposed = 'Rhône', unicodedata.normalize('NFD', 'Rhône')
+    assert collator.sort_key(composed)[:3] == collator.sort_key(decomposed)[:3]
+    assert collator.sort_key(composed) != collator.sort_key(decomposed)
+
+
+def test_report_key_puts_counts_first():
+    items = [('Cote', 1), ('Côte', 3), ('Barolo', 1)]
+    assert sorted(items, key=Collator().report_key) == [('Côte', 3), ('Barolo', 1), ('Cote', 1)]
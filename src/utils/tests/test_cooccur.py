@@ -0,0 +1,33 @@
+from cooccur import PairCounter
+
+
+def test_pairs_are_unordered_and_deduplicated_per_group():
+    counter = PairCounter()
+    counter.add_group(['Rioja', 'Barolo', 'Rioja'])
+    counter.add_group(['Barolo', 'Rioja'])
+    assert counter.groups == 2
+    assert counter.top(5) == [('Barolo', 'Rioja', 2)]
+
+
+def test_top_orders_by_count_then_labels():
+    counter = PairCounter()
+    counter.add_records([
+        ('o1', 'Rioja'), ('o1', 'Barolo'), ('o1', 'Chablis'),
+        ('o2', 'Chablis'), ('o2', 'Rioja'),
+        ('o3', 'Barolo'), ('o3', 'Chablis'),
+        ('o4', 'Mosel'),
+    ])
+    assert counter.groups == 4
+    assert counter.top(10) == [
+        ('Barolo', 'Chablis', 2),
+        ('Chablis', 'Rioja', 2),
+        ('Barolo', 'Rioja', 1),
+    ]
+    assert counter.top(1) == [('Barolo', 'Chablis', 2)]
+
+
+def test_labels_sort_regardless_of_first_seen_code():
+    counter = PairCounter()
+    counter.add_group(['Zinfandel', 'Albariño'])
+    counter.add_group(['Albariño', 'Zinfandel'])
+    assert counter.top(1) == [('Albariño', 'Zinfandel', 2)]
@@ -0,0 +1,54 @@
+import bz2
+import gzip
+import lzma
+
+import pytest
+
+from decompress import iter_chunks, iter_lines, split_lines
+
+LINES = ['Burgundy Côte de Nuits Red', '', 'French Champagne', 'Mosel Riesling']
+DATA = ('\n'.join(LINES) + '\n').encode('utf-8')
+
+
+def _zstd_compress(data):
+    try:
+        from compression import zstd
+    except ImportError:
+        zstandard = pytest.importorskip('zstandard')
+        return zstandard.ZstdCompressor().compress(data)
+    return zstd.compress(data)
+
+
+@pytest.mark.parametrize('suffix, compress', [
+    ('.txt', lambda data: data),
+    ('.gz', gzip.compress),
+    ('.bz2', bz2.compress),
+    ('.xz', lzma.compress),
+    ('.zst', _zstd_compress),
+])
+def test_iter_lines_reads_every_format(tmp_path, suffix, compress):
+    path = tmp_path / f"regions{suffix}"
+    path.write_bytes(compress(DATA))
+    assert list(iter_lines(str(path))) == LINES
+
+
+def test_final_line_without_newline(tmp_path):
+    path = tmp_path / 'regions.txt'
+    path.write_bytes(DATA.rstrip(b'\n'))
+    assert list(iter_lines(str(path))) == LINES
+
+
+def test_chunks_reassemble_and_start_at_offset(tmp_path):
+    path = tmp_path / 'regions.gz'
+    path.write_bytes(gzip.compress(DATA))
+    assert b''.join(iter_chunks(str(path), chunk_size=5, depth=2)) == DATA
+    assert b''.join(iter_chunks(str(path), chunk_size=5, start=10)) == DATA[10:]
+
+
+def test_reader_errors_reach_the_consumer(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        list(iter_lines(str(tmp_path / 'missing.txt')))
+
+
+def test_split_lines_applies_transform_first():
+    assert split_lines(b'a\r\nb\r\n', transform=lambda block: block.replace(b'\r', b'')) == ['a', 'b']
@@ -0,0 +1,37 @@
+import random
+
+import pytest
+
+from collation import Collator
+from extsort import estimate_bytes, report_key, sort_counts
+
+COUNTS = {f"Région {i:04d}": random.Random(i).randrange(1, 6) for i in range(3000)}
+EXPECTED = sorted(COUNTS.items(), key=report_key)
+
+
+def test_in_memory_sort_is_report_order():
+    assert list(sort_counts(COUNTS)) == EXPECTED
+    assert list(sort_counts(COUNTS, memory_budget=estimate_bytes(COUNTS))) == EXPECTED
+
+
+@pytest.mark.parametrize('workers', [None, 2])
+def test_spilled_sort_matches(tmp_path, workers):
+    budget = estimate_bytes(COUNTS) // 10
+    assert list(sort_counts(COUNTS, workers, budget, tmpdir=str(tmp_path))) == EXPECTED
+
+
+def test_more_runs_than_the_fan_in(tmp_path):
+    budget = estimate_bytes(COUNTS) // 100  # about 100 runs
+    assert list(sort_counts(COUNTS, memory_budget=budget, tmpdir=str(tmp_path), fan_in=4)) == EXPECTED
+    collator = Collator()
+    expected = sorted(COUNTS.items(), key=collator.report_key)
+    assert list(sort_counts(COUNTS, memory_budget=budget, tmpdir=str(tmp_path), collator=collator, fan_in=4)) == expected
+
+
+def test_spilled_sort_with_collation(tmp_path):
+    counts = {'Cote': 2, 'Côte': 2, 'cote': 2, 'Barolo': 2, 'Zinfandel': 3, 'Œil de Perdrix': 2, 'Oeil': 2}
+    expected = sorted(counts.items(), key=Collator().report_key)
+    collator = Collator()
+    assert list(sort_counts(counts, memory_budget=1, tmpdir=str(tmp_path), collator=collator)) == expected
+    assert list(sort_counts(counts, 2, 1, tmpdir=str(tmp_path), collator=collator)) == expected
+    assert not collator._keys  # the spilled sort does not fill the key cache
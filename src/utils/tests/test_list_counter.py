@@ -0,0 +1,40 @@
+import importlib.util
+import os
+
+import pytest
+
+_spec = importlib.util.spec_from_file_location(
+    'list_counter', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'list-counter.py'))
+list_counter = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(list_counter)
+
+
+def _error(capsys, *argv):
+    with pytest.raises(SystemExit) as exc:
+        list_counter.main(list(argv))
+    assert exc.value.code == 2
+    return capsys.readouterr().err.splitlines()[-1]
+
+
+def test_snapshot_report_honors_top_only(tmp_path, capsys):
+    snapshot = str(tmp_path / 'counts.snap')
+    list_counter.main(['--write-snapshot', snapshot])
+    capsys.readouterr()
+    list_counter.main(['--snapshot', snapshot, '--top', '1'])
+    assert capsys.readouterr().out.splitlines()[-1] == 'Burgundy Côte de Nuits Red: 169'
+    assert _error(capsys, '--snapshot', snapshot, '--collate', '--stats').endswith(
+        '--snapshot cannot be combined with --collate, --stats')
+
+
+@pytest.mark.parametrize('argv, message', [
+    (['--checkpoint', 'c', '--pairs', '3'], '--pairs cannot be combined with --checkpoint'),
+    (['--vintages', '--sample', '10'], '--vintages cannot be combined with --sample'),
+    (['--sample', '10', '--styles'], '--sample cannot be combined with --styles'),
+    (['regions.txt', '--merge-summaries', 's.json'], '--merge-summaries cannot be combined with input files'),
+    (['--resume'], '--resume needs --checkpoint'),
+    (['--by-decade'], '--by-decade needs --vintages'),
+    (['--sketch-width', '64'], '--sketch-width needs --write-summary'),
+    (['--sort-workers', '2'], '--sort-workers needs --memory-budget'),
+])
+def test_ignored_options_are_rejected(capsys, argv, message):
+    assert _error(capsys, *argv).endswith(message)
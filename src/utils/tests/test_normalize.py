@@ -0,0 +1,34 @@
+from normalize import Normalizer
+
+
+def test_clean_block_is_untouched():
+    normalizer = Normalizer()
+    block = 'Burgundy Red\nCôte-Rotie\n'.encode()
+    assert normalizer(block) == block
+    assert set(normalizer.changed.values()) == {0}
+
+
+def test_rules_count_changed_lines_once_each():
+    normalizer = Normalizer()
+    block = (
+        'Burgundy  Red  White\r\n'    # crlf, collapse (two runs, one line)
+        'Napa\u00a0Valley\u202f\n'   # nbsp, then strip of the trailing space it leaves
+        '\tRioja \n'                  # tabs, strip (both edges, one line)
+        '  Barolo\n'                   # strip
+        'Mosel Riesling\n'
+    ).encode()
+    assert normalizer(block) == b'Burgundy Red White\nNapa Valley\nRioja\nBarolo\nMosel Riesling\n'
+    assert normalizer.changed == {'crlf': 1, 'nbsp': 1, 'tabs': 1, 'strip': 3, 'collapse': 1}
+
+
+def test_counts_accumulate_across_blocks():
+    normalizer = Normalizer()
+    normalizer(b'a \n')
+    normalizer(b' b\n c\n')
+    assert normalizer.changed['strip'] == 3
+
+
+def test_clean_normalizes_one_field():
+    normalizer = Normalizer()
+    assert normalizer.clean(' Napa\u00a0 Valley\r') == 'Napa Valley'
+    assert normalizer.changed == {'crlf': 1, 'nbsp': 1, 'tabs': 0, 'strip': 1, 'collapse': 1}
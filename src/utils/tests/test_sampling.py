@@ -0,0 +1,68 @@
+from collections import Counter
+
+from sampling import SampleEstimator, preview
+
+
+def test_full_reservoir_gives_exact_counts():
+    estimator = SampleEstimator(100, seed=1)
+    for region in ['Rioja'] * 30 + ['Barolo'] * 10:
+        estimator.add(region)
+    rows = estimator.estimates()
+    assert [(region, estimate) for region, estimate, *_ in rows] == [('Rioja', 30.0), ('Barolo', 10.0)]
+    # Every line is in the sample, so the finite population correction
+    # collapses the interval to the estimate.
+    assert all(low == estimate == high for _, estimate, low, high in rows)
+
+
+def test_dropping_the_correction_widens_the_interval():
+    estimator = SampleEstimator(100, seed=1)
+    for region in ['Rioja', 'Barolo'] * 20:
+        estimator.add(region)
+    _, estimate, low, high = estimator.estimates(finite=False)[0]
+    assert low < estimate == 20.0 < high
+
+
+def test_strata_are_scaled_by_their_own_population():
+    estimator = SampleEstimator(10, seed=3)
+    for _ in range(1000):
+        estimator.add('Rioja', 'b1')
+    for _ in range(10):
+        estimator.add('Barolo', 'b2')
+    assert estimator.strata == 2
+    assert estimator.seen == 1010
+    assert dict((region, estimate) for region, estimate, *_ in estimator.estimates()) == {
+        'Rioja': 1000.0, 'Barolo': 10.0}
+    assert estimator.top(1) == ('Rioja',)
+
+
+def test_hit_counts_follow_the_reservoir():
+    estimator = SampleEstimator(20, seed=7)
+    for i in range(5000):
+        estimator.add('region-%d' % (i % 37), 'b%d' % (i % 3))
+    for stratum, reservoir in estimator._reservoirs.items():
+        assert estimator._hits[stratum] == Counter(reservoir)
+
+
+def test_top_matches_the_estimate_ranking():
+    estimator = SampleEstimator(50, seed=2)
+    for i in range(3000):
+        estimator.add('region-%d' % (i * i % 23), 'b%d' % (i % 4))
+    assert estimator.top(5) == tuple(region for region, *_ in estimator.estimates()[:5])
+
+
+def test_preview_stops_once_the_ranking_is_stable():
+    records = (('', 'Rioja' if i % 3 else 'Barolo') for i in range(100000))
+    estimator, stopped = preview(records, 100, k=2, patience=3, seed=1)
+    assert stopped
+    assert estimator.seen == 400
+    assert estimator.top(2) == ('Rioja', 'Barolo')
+
+
+def test_checks_are_spaced_by_strata():
+    # After the first check at 100 lines, each check waits for 100 more
+    # lines per stratum: 100, 5100, 10100 and 15100 with 50 strata.
+    records = [('b%d' % (i % 50), 'Rioja') for i in range(20000)]
+    estimator, stopped = preview(records, 100, k=1, patience=3, seed=1)
+    assert stopped and estimator.seen == 15100
+    estimator, stopped = preview(records, 100, k=1, patience=3, check_every=100, seed=1)
+    assert stopped and estimator.seen == 400
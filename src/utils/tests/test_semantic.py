@@ -0,0 +1,58 @@
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from semantic import cluster_labels, count_clusters, load_vectors  # noqa: E402
+
+VECTORS = {
+    'Napa Valley Cabernet Sauvignon': [1.0, 0.0, 0.0],
+    'Napa Cabernet': [0.96, 0.28, 0.0],    # close to the first
+    'Napa Cab Sauv': [0.84, 0.54, 0.0],    # close to the second only
+    'Mosel Riesling': [0.0, 0.0, 2.0],     # scale does not matter
+    'German Riesling': [0.0, 0.3, 1.0],
+    'Placeholder': [0.0, 0.0, 0.0],        # zero vector links to nothing
+}
+
+
+@pytest.fixture
+def vectors(tmp_path):
+    path = tmp_path / 'regions.npy'
+    np.save(path, np.array(list(VECTORS.values()), dtype=np.float32))
+    (tmp_path / 'regions.txt').write_text('\n'.join(VECTORS) + '\n', encoding='utf-8')
+    return load_vectors(str(path))
+
+
+def test_single_linkage_chains_through_neighbours(vectors):
+    index, matrix = vectors
+    clusters = cluster_labels(list(VECTORS) + ['Rioja'], index, matrix, threshold=0.95, batch_rows=2)
+    assert sorted(map(sorted, clusters)) == [
+        ['German Riesling', 'Mosel Riesling'],
+        ['Napa Cab Sauv', 'Napa Cabernet', 'Napa Valley Cabernet Sauvignon'],
+        ['Placeholder'],
+        ['Rioja'],
+    ]
+
+
+def test_threshold_splits_weak_links(vectors):
+    index, matrix = vectors
+    clusters = cluster_labels(list(VECTORS), index, matrix, threshold=0.99)
+    assert all(len(cluster) == 1 for cluster in clusters)
+
+
+def test_leader_is_the_most_counted_member(vectors):
+    index, matrix = vectors
+    counts = {'Napa Valley Cabernet Sauvignon': 2, 'Napa Cabernet': 5, 'Napa Cab Sauv': 5,
+              'Mosel Riesling': 4, 'German Riesling': 1, 'Rioja': 20}
+    assert count_clusters(counts, index, matrix, threshold=0.95) == [
+        ('Rioja', 20, ['Rioja']),
+        ('Napa Cab Sauv', 12, ['Napa Cab Sauv', 'Napa Cabernet', 'Napa Valley Cabernet Sauvignon']),
+        ('Mosel Riesling', 5, ['Mosel Riesling', 'German Riesling']),
+    ]
+
+
+def test_label_file_must_match_the_matrix(tmp_path):
+    path = tmp_path / 'regions.npy'
+    np.save(path, np.zeros((2, 3), dtype=np.float32))
+    (tmp_path / 'regions.txt').write_text('only one\n', encoding='utf-8')
+    with pytest.raises(ValueError, match='2 vectors but 1 labels'):
+        load_vectors(str(path))
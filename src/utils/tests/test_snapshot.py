@@ -0,0 +1,47 @@
+import pytest
+
+from snapshot import Snapshot, write_snapshot
+from spill import SpillingCounter
+
+COUNTS = {'Rioja': 3, 'Barolo': 5, 'Côte-Rotie': 3, 'Chablis': 1}
+
+
+def test_lookup_and_report_order(tmp_path):
+    path = str(tmp_path / 'counts.snap')
+    write_snapshot(path, COUNTS)
+    with Snapshot(path) as snap:
+        assert len(snap) == 4
+        assert snap.total == 12
+        assert snap.get('Côte-Rotie') == 3
+        assert snap.get('Cote-Rotie') == 0
+        assert 'Chablis' in snap and 'Mosel' not in snap
+        assert snap.top() == [('Barolo', 5), ('Côte-Rotie', 3), ('Rioja', 3), ('Chablis', 1)]
+        assert snap.top(2, start=1) == [('Côte-Rotie', 3), ('Rioja', 3)]
+
+
+def test_empty_snapshot(tmp_path):
+    path = str(tmp_path / 'empty.snap')
+    write_snapshot(path, {})
+    with Snapshot(path) as snap:
+        assert len(snap) == 0 and snap.total == 0
+        assert snap.top(3) == []
+        assert snap.get('Rioja') == 0
+
+
+def test_spilled_counts_write_the_same_file(tmp_path):
+    counter = SpillingCounter(1, tmpdir=str(tmp_path))
+    counter.update(region for region, count in COUNTS.items() for _ in range(count))
+    write_snapshot(str(tmp_path / 'spilled.snap'), counter.finish())
+    write_snapshot(str(tmp_path / 'plain.snap'), COUNTS)
+    assert (tmp_path / 'spilled.snap').read_bytes() == (tmp_path / 'plain.snap').read_bytes()
+
+
+def test_rejects_other_files(tmp_path):
+    path = tmp_path / 'counts.snap'
+    path.write_bytes(b'not a snapshot at all, just some bytes')
+    with pytest.raises(ValueError, match='not a count snapshot'):
+        Snapshot(str(path))
+    write_snapshot(str(path), COUNTS)
+    path.write_bytes(path.read_bytes()[:-2])
+    with pytest.raises(ValueError, match='truncated'):
+        Snapshot(str(path))
@@ -0,0 +1,50 @@
+import os
+import random
+from collections import Counter
+
+import pytest
+
+from extsort import read_run, reduce_runs, write_run
+from spill import SpilledCounts, SpillingCounter, key_sorted_items, sum_runs
+
+LABELS = [f"Région {random.Random(i).randrange(500):03d}" for i in range(20000)]
+
+
+def test_counts_within_budget_stay_in_memory():
+    counter = SpillingCounter(10**9)
+    counter.update(LABELS)
+    counts = counter.finish()
+    assert counts == Counter(LABELS)
+    assert not counter.runs
+
+
+@pytest.mark.parametrize('fan_in', [2, 3, 64])
+def test_more_runs_than_the_fan_in_merge_exactly(tmp_path, fan_in):
+    counter = SpillingCounter(2000, tmpdir=str(tmp_path), fan_in=fan_in)
+    counter.update(LABELS)
+    counts = counter.finish()
+    expected = Counter(LABELS)
+    assert isinstance(counts, SpilledCounts)
+    assert len(counter.runs) > 64
+    assert len(counts) == len(expected)
+    assert list(counts.items()) == sorted(expected.items())
+    assert list(key_sorted_items(counts)) == sorted(expected.items())
+    assert counts['Région 007'] == expected['Région 007']
+    with pytest.raises(KeyError):
+        counts['Barolo']
+    # Only the merged run is left on disk
+    assert os.listdir(counts._spill_dir.name) == ['counts.tsv']
+
+
+def test_reduce_runs_stops_at_keep(tmp_path):
+    paths = []
+    for i in range(10):
+        path = str(tmp_path / f"run-{i}.tsv")
+        write_run(path, [('Barolo', 1), (f"Rioja {i}", i + 1)])
+        paths.append(path)
+    remaining = reduce_runs(paths, sum_runs, str(tmp_path), fan_in=3, keep=3)
+    assert len(remaining) <= 3
+    merged = Counter()
+    for path in remaining:
+        merged.update(dict(read_run(path)))
+    assert merged == Counter({'Barolo': 10, **{f"Rioja {i}": i + 1 for i in range(10)}})
@@ -0,0 +1,32 @@
+import math
+
+from stats import distribution
+
+
+def test_even_distribution():
+    stats = distribution({'a': 5, 'b': 5, 'c': 5, 'd': 5})
+    assert stats['total'] == 20
+    assert stats['regions'] == 4
+    assert stats['coverage'] == {0.5: 2, 0.8: 4, 0.95: 4}
+    assert stats['gini'] == 0
+    assert stats['entropy'] == 2
+    assert stats['normalized_entropy'] == 1
+
+
+def test_concentrated_distribution():
+    stats = distribution({'a': 7, 'b': 1, 'c': 1, 'd': 1})
+    assert stats['coverage'] == {0.5: 1, 0.8: 2, 0.95: 4}
+    # Gini from its definition: mean absolute difference over twice the mean
+    values = [7, 1, 1, 1]
+    mean_difference = sum(abs(x - y) for x in values for y in values) / len(values) ** 2
+    assert math.isclose(stats['gini'], mean_difference / (2 * sum(values) / len(values)))
+
+
+def test_histogram_uses_power_of_two_buckets():
+    stats = distribution({'a': 1, 'b': 2, 'c': 3, 'd': 4, 'e': 9})
+    assert stats['histogram'] == [(1, 1, 1, 1), (2, 3, 2, 5), (4, 7, 1, 4), (8, 15, 1, 9)]
+
+
+def test_zero_counts_are_ignored():
+    assert distribution({'a': 0})['regions'] == 0
+    assert distribution({'a': 3, 'b': 0})['coverage'] == {0.5: 1, 0.8: 1, 0.95: 1}
@@ -0,0 +1,46 @@
+import unicodedata
+
+from styles import UNKNOWN, Automaton, StyleClassifier
+
+
+def test_style_marker_beats_colour_word():
+    classify = StyleClassifier().classify
+    assert classify('White Port') == 'Fortified'
+    assert classify('Spanish Manzanilla Sherry Fortified') == 'Fortified'
+    assert classify('Burgundy Côte de Nuits Red') == 'Red'
+
+
+def test_colour_word_beats_grape():
+    classify = StyleClassifier().classify
+    assert classify('Oregon Pinot Noir Rosé') == 'Rosé'
+    assert classify('Napa Valley Cabernet Sauvignon') == 'Red'
+
+
+def test_rightmost_match_wins_within_a_tier():
+    assert StyleClassifier().classify('Red White') == 'White'
+    assert StyleClassifier().classify('White Red') == 'Red'
+
+
+def test_tokens_must_be_whole_words():
+    classify = StyleClassifier().classify
+    assert classify('Jura Vin Jaune') == 'White'
+    assert classify('Macvin') == 'Fortified'
+    assert classify('Greek') == UNKNOWN
+    assert classify('Portugal Douro') == UNKNOWN
+
+
+def test_decomposed_labels_match_composed_tokens():
+    classify = StyleClassifier().classify
+    assert classify(unicodedata.normalize('NFD', 'Northern Rhône Côte-Rotie')) == 'Red'
+    assert classify(unicodedata.normalize('NFD', 'Austrian Blaufränkisch')) == 'Red'
+    assert classify(unicodedata.normalize('NFD', 'Mexican Rosé')) == 'Rosé'
+
+
+def test_overlapping_patterns_all_match():
+    automaton = Automaton({'he': 1, 'she': 2, 'hers': 3})
+    assert sorted(automaton.iter_matches('ushers')) == [(1, 4, 2), (2, 4, 1), (2, 6, 3)]
+
+
+def test_count_styles_folds_counts():
+    counts = {'White Port': 2, 'Barolo': 3, 'Mosel Riesling': 1, 'Greek': 4}
+    assert StyleClassifier().count_styles(counts) == {'Fortified': 2, 'Red': 3, 'White': 1, UNKNOWN: 4}
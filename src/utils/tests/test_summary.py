@@ -0,0 +1,78 @@
+import json
+from collections import Counter
+
+import pytest
+
+from summary import CountMinSketch, CountSummary, merge_all, write_summary
+
+PARTS = {
+    'node-a': {'Rioja': 4, 'Barolo': 1},
+    'node-b': {'Rioja': 2, 'Chablis': 7},
+    'node-c': {'Barolo': 3, 'Mosel Riesling': 1},
+}
+
+
+def summaries(width=64, exact=True):
+    return [CountSummary.from_counts(counts, source, width, exact=exact) for source, counts in PARTS.items()]
+
+
+def test_merge_is_associative_and_commutative():
+    a, b, c = summaries()
+    left, right, shuffled = a.merge(b).merge(c), a.merge(b.merge(c)), c.merge(a).merge(b)
+    for merged in (right, shuffled, merge_all([a, b, c])):
+        assert merged.to_dict() == left.to_dict()
+    assert left.counts == Counter({'Chablis': 7, 'Rioja': 6, 'Barolo': 4, 'Mosel Riesling': 1})
+    assert left.total == 18
+    assert left.sources == ('node-a', 'node-b', 'node-c')
+
+
+def test_sketch_only_merge_never_underestimates():
+    merged = merge_all(summaries(exact=False))
+    assert merged.counts is None
+    assert merged.total == 18
+    for key, count in {'Chablis': 7, 'Rioja': 6, 'Barolo': 4, 'Mosel Riesling': 1}.items():
+        assert merged.estimate(key) >= count
+    exact = merge_all(summaries())
+    assert merged.sketch.table == exact.sketch.table
+
+
+def test_exact_merged_with_sketch_only_keeps_the_sketch():
+    a, _, _ = summaries()
+    merged = a.merge(CountSummary.from_counts(PARTS['node-c'], 'node-c', 64, exact=False))
+    assert merged.counts is None
+    assert merged.estimate('Barolo') >= 4
+
+
+def test_merge_rejects_overlap_and_mismatched_shapes():
+    a, b, _ = summaries()
+    with pytest.raises(ValueError, match='overlap'):
+        a.merge(a)
+    exact_only = CountSummary.from_counts(PARTS['node-a'], 'node-a')
+    narrow = CountSummary.from_counts(PARTS['node-c'], 'node-c', 16, exact=False)
+    with pytest.raises(ValueError, match='neither'):
+        exact_only.merge(narrow)
+    with pytest.raises(ValueError, match='shapes'):
+        b.merge(narrow)
+    with pytest.raises(ValueError):
+        merge_all([])
+
+
+def test_sketch_only_needs_a_width():
+    with pytest.raises(ValueError):
+        CountSummary.from_counts(PARTS['node-a'], 'node-a', exact=False)
+
+
+def test_dump_load_and_streaming_writer_agree(tmp_path):
+    a = CountSummary.from_counts(PARTS['node-a'], 'node-a', 64)
+    a.dump(str(tmp_path / 'a.json'))
+    write_summary(str(tmp_path / 'b.json'), PARTS['node-a'], 'node-a', 64)
+    loaded = CountSummary.load(str(tmp_path / 'a.json'))
+    assert loaded.to_dict() == a.to_dict()
+    assert json.loads((tmp_path / 'b.json').read_text(encoding='utf-8')) == a.to_dict()
+
+
+def test_sketch_hashing_is_stable():
+    sketch = CountMinSketch(16, 2)
+    sketch.add('Rioja', 3)
+    assert sum(map(sum, sketch.table)) == 6
+    assert CountMinSketch(16, 2, [row[:] for row in sketch.table]).estimate('Rioja') == 3
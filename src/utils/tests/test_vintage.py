@@ -0,0 +1,56 @@
+from vintage import VintageCounter, VintageHistogram, parse_vintage
+
+
+def histogram(*years):
+    h = VintageHistogram()
+    for year in years:
+        h.add(year)
+    h.freeze()
+    return h
+
+
+def test_parse_vintage():
+    assert parse_vintage(' 2015 ') == 2015
+    assert parse_vintage('NV') is None
+    assert parse_vintage('') is None
+    assert parse_vintage('15') is None
+
+
+def test_histogram_holds_one_slot_per_year():
+    assert len(histogram(2000, 2010).years) == 11
+    assert len(histogram(2010, 2000).years) == 11
+    assert len(histogram(2000, 2010, 2005, 1998).years) == 13
+
+
+def test_range_count_is_inclusive_and_clamped():
+    h = histogram(2012, 2015, 2015, 2019, 2020, None)
+    assert h.range_count(2015, 2015) == 2
+    assert h.range_count(2012, 2019) == 4
+    assert h.range_count(1900, 2100) == 5
+    assert h.range_count(2016, 2018) == 0
+    assert h.range_count(2021, 2030) == 0
+    assert h.range_count(2019, 2012) == 0
+    assert h.non_vintage == 1
+    assert h.total == 6
+
+
+def test_range_count_after_earlier_vintage_added():
+    h = histogram(2015)
+    h.add(2001, 3)
+    assert h.range_count(2000, 2009) == 3
+    assert h.range_count(2001, 2015) == 4
+
+
+def test_by_decade_skips_empty_decades():
+    h = histogram(1999, 2000, 2009, 2020, 2021, None)
+    assert h.by_decade() == [(1990, 1), (2000, 2), (2020, 2)]
+    assert VintageHistogram().by_decade() == []
+
+
+def test_counter_reads_region_tab_vintage_lines():
+    counter = VintageCounter()
+    counter.add_lines(['Rioja\t2010', 'Rioja\tNV', 'Barolo', 'Rioja\t2014', '\t2015'])
+    counter.freeze()
+    assert counter.totals() == {'Rioja': 3, 'Barolo': 1}
+    assert counter.regions['Rioja'].range_count(2010, 2014) == 2
+    assert counter.regions['Barolo'].non_vintage == 1
@@ -0,0 +1,114 @@
+"""Per-region vintage histograms with O(1) range queries.
+
+Instead of folding the vintage into the label (which multiplies key
+cardinality and rules out range queries), each region keeps its bottle
+counts in a compact integer array indexed by ``year - first_year``. Once
+counting is done, ``freeze`` builds a prefix-sum array per region, so the
+count for any vintage range (a decade, "2015-2020") is one subtraction.
+Bottles without a usable vintage (NV, blanks) are counted separately.
+"""
+
+from array import array
+
+MIN_YEAR, MAX_YEAR = 1000, 9999
+
+
+def parse_vintage(text):
+    """Return the vintage year in ``text``, or None for non-vintage values."""
+    text = text.strip()
+    if text.isdigit() and MIN_YEAR <= int(text) <= MAX_YEAR:
+        return int(text)
+    return None
+
+
+class VintageHistogram:
+    """Bottle counts of one region by vintage year."""
+
+    def __init__(self):
+        self.first = None
+        self.years = array('I')
+        self.non_vintage = 0
+        self.vintage_total = 0
+        self._prefix = None
+
+    def add(self, year, count=1):
+        if year is None:
+            self.non_vintage += count
+            return
+        if self.first is None:
+            self.first = year
+        elif year < self.first:
+            self.years[:0] = array('I', bytes(4 * (self.first - year)))
+            self.first = year
+        offset = year - self.first
+        if offset >= len(self.years):
+            self.years.frombytes(bytes(4 * (offset + 1 - len(self.years))))
+        self.years[offset] += count
+        self.vintage_total += count
+        self._prefix = None
+
+    @property
+    def total(self):
+        return self.vintage_total + self.non_vintage
+
+    def freeze(self):
+        prefix = array('Q', [0])
+        running = 0
+        for count in self.years:
+            running += count
+            prefix.append(running)
+        self._prefix = prefix
+
+    def range_count(self, low, high):
+        """Bottles with ``low <= vintage <= high``."""
+        if self.first is None:
+            return 0
+        if self._prefix is None:
+            self.freeze()
+        start = min(max(low - self.first, 0), len(self.years))
+        stop = min(max(high - self.first + 1, 0), len(self.years))
+        return self._prefix[stop] - self._prefix[start] if stop > start else 0
+
+    def by_decade(self):
+        """Return ``(decade, count)`` for every decade with bottles."""
+        if self.first is None:
+            return []
+        rows = []
+        last = self.first + len(self.years) - 1
+        for decade in range(self.first - self.first % 10, last + 1, 10):
+            count = self.range_count(decade, decade + 9)
+            if count:
+                rows.append((decade, count))
+        return rows
+
+
+class VintageCounter:
+    """``region -> VintageHistogram`` built from ``region<TAB>vintage`` lines."""
+
+    def __init__(self):
+        self.regions = {}
+
+    def add(self, region, year, count=1):
+        histogram = self.regions.get(region)
+        if histogram is None:
+            histogram = self.regions[region] = VintageHistogram()
+        histogram.add(year, count)
+
+    def add_lines(self, lines, normalizer=None):
+        """Count ``region<TAB>vintage`` lines; ``normalizer`` only rewrites the region field."""
+        for line in lines:
+            region, sep, vintage = line.rpartition('\t')
+            if not sep:
+                region, vintage = vintage, ''
+            if normalizer is not None:
+                region = normalizer.clean(region)
+            region = region.strip()
+            if region:
+                self.add(region, parse_vintage(vintage))
+
+    def freeze(self):
+        for histogram in self.regions.values():
+            histogram.freeze()
+
+    def totals(self):
+        return {region: histogram.total for region, histogram in self.regions.items()}